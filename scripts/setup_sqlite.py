@@ -182,6 +182,7 @@ def create_sqlite_database() -> str:
                 file_path TEXT NOT NULL,
                 file_name TEXT NOT NULL,
                 file_size INTEGER,
+                mtime_ns INTEGER,
                 file_hash TEXT NOT NULL,
                 platform_id INTEGER,
                 processing_status TEXT NOT NULL CHECK (processing_status IN ('pending', 'processing', 'completed', 'failed', 'skipped')),
@@ -308,18 +309,20 @@ def create_sqlite_database() -> str:
             "CREATE INDEX idx_streaming_records_quality ON streaming_records(data_quality_score)",
             
             # Artists and tracks indexes
-            "CREATE INDEX idx_artists_normalized ON artists(name_normalized)",
+            "CREATE UNIQUE INDEX idx_artists_normalized ON artists(name_normalized)",
             "CREATE INDEX idx_artists_name ON artists(name)",
             "CREATE INDEX idx_tracks_normalized ON tracks(title_normalized)",
             "CREATE INDEX idx_tracks_isrc ON tracks(isrc)",
             "CREATE INDEX idx_tracks_artist ON tracks(artist_id)",
             "CREATE INDEX idx_tracks_title ON tracks(title)",
+            "CREATE UNIQUE INDEX idx_tracks_title_artist ON tracks(title_normalized, artist_id)",
             
             # Processing logs indexes
             "CREATE INDEX idx_processing_logs_hash ON data_processing_logs(file_hash)",
             "CREATE INDEX idx_processing_logs_status ON data_processing_logs(processing_status)",
             "CREATE INDEX idx_processing_logs_platform ON data_processing_logs(platform_id)",
             "CREATE INDEX idx_processing_logs_path ON data_processing_logs(file_path)",
+            "CREATE INDEX idx_processing_logs_file_stat ON data_processing_logs(file_path, file_size, mtime_ns)",
             "CREATE INDEX idx_processing_logs_started ON data_processing_logs(started_at)",
             
             # Quality scores indexes
@@ -14,9 +14,9 @@ import json
 from typing import Any, Optional
 
 from sqlalchemy import (
-    Column, Integer, String, DateTime, Numeric, Text, 
+    Column, Integer, BigInteger, String, DateTime, Numeric, Text, 
     Boolean, Index, ForeignKey,
-    create_engine, text
+    create_engine, inspect, text
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker, Mapped, mapped_column
@@ -24,9 +24,29 @@ from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.types import TypeDecorator, CHAR
 from contextlib import contextmanager
 
+try:
+    import orjson
+except ImportError:  # orjson is optional - fall back to stdlib json
+    orjson = None
+
 logger = logging.getLogger(__name__)
 Base = declarative_base()
 
+
+def json_dumps(value: Any) -> str:
+    """Serialize to JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+def json_loads(value: str | bytes) -> Any:
+    """Deserialize JSON, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
 # SQLite-compatible UUID type
 class GUID(TypeDecorator):
     """Platform-independent GUID type."""
@@ -63,13 +83,13 @@ class JSONType(TypeDecorator):
 
     def process_bind_param(self, value, dialect):
         if value is not None:
-            return json.dumps(value)
+            return json_dumps(value)
         return value
 
     def process_result_value(self, value, dialect):
         if value is not None:
             try:
-                return json.loads(value)
+                return json_loads(value)
             except (ValueError, TypeError):
                 return value
         return value
@@ -113,7 +133,7 @@ class Artist(Base):
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     name: Mapped[str] = mapped_column(String(500), nullable=False, index=True)
-    name_normalized: Mapped[str] = mapped_column(String(500), nullable=False, index=True)
+    name_normalized: Mapped[str] = mapped_column(String(500), nullable=False, unique=True, index=True)
     external_ids: Mapped[Optional[dict]] = mapped_column(get_json_type(), nullable=True)
     artist_metadata: Mapped[Optional[dict]] = mapped_column(get_json_type(), nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
@@ -146,6 +166,11 @@ class Track(Base):
     # Relationships
     artist: Mapped["Artist"] = relationship("Artist", back_populates="tracks")
     streaming_records: Mapped[list["StreamingRecord"]] = relationship("StreamingRecord", back_populates="track")
+    
+    # Natural key used for get-or-create upserts
+    __table_args__ = (
+        Index('ix_tracks_title_artist', 'title_normalized', 'artist_id', unique=True),
+    )
 
 class StreamingRecord(Base):
     """Main hypertable for streaming data - optimized for time-series queries"""
@@ -208,7 +233,8 @@ class DataProcessingLog(Base):
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     file_path: Mapped[str] = mapped_column(String(1000), nullable=False)
     file_name: Mapped[str] = mapped_column(String(255), nullable=False)
-    file_size: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    file_size: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
+    mtime_ns: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
     file_hash: Mapped[str] = mapped_column(String(64), nullable=False, index=True)
     platform_id: Mapped[int] = mapped_column(Integer, ForeignKey('platforms.id'), nullable=False)
     
@@ -233,6 +259,11 @@ class DataProcessingLog(Base):
     
     # Relationships
     platform: Mapped["Platform"] = relationship("Platform", back_populates="processing_logs")
+    
+    # Indexes
+    __table_args__ = (
+        Index('ix_data_processing_logs_file_stat', 'file_path', 'file_size', 'mtime_ns'),
+    )
 
 class QualityScore(Base):
     """Data quality tracking by file and platform"""
@@ -287,6 +318,13 @@ class FileProcessingQueue(Base):
     # Relationships
     platform: Mapped[Optional["Platform"]] = relationship("Platform")
 
+def _has_unique_index(conn, table_name: str, columns: list[str]) -> bool:
+    """Check whether a unique index or constraint covers exactly the given columns"""
+    inspector = inspect(conn)
+    unique_keys = [index['column_names'] for index in inspector.get_indexes(table_name) if index['unique']]
+    unique_keys += [constraint['column_names'] for constraint in inspector.get_unique_constraints(table_name)]
+    return any(sorted(key) == sorted(columns) for key in unique_keys)
+
 class DatabaseManager:
     """Manages database connections and TimescaleDB setup"""
     
@@ -298,6 +336,8 @@ class DatabaseManager:
         # Create engine with appropriate settings
         engine_kwargs: dict[str, Any] = {
             'pool_pre_ping': True,
+            'json_serializer': json_dumps,
+            'json_deserializer': json_loads,
             'echo': os.getenv('DATABASE_DEBUG', 'false').lower() == 'true'
         }
         
@@ -306,6 +346,8 @@ class DatabaseManager:
             postgres_settings = {
                 'pool_size': 10,
                 'max_overflow': 20,
+                # executemany INSERTs are sent as multi-row VALUES pages (insertmanyvalues)
+                'insertmanyvalues_page_size': 5000,
             }
             engine_kwargs.update(postgres_settings)
         
@@ -317,6 +359,95 @@ class DatabaseManager:
         Base.metadata.create_all(bind=self.engine)
         logger.info("Database tables created")
     
+    def upgrade_schema(self):
+        """
+        Bring tables created by older versions up to the current schema
+        
+        create_all never alters existing tables, so columns and indexes added since
+        then are added here. Safe to run repeatedly.
+        """
+        with self.engine.begin() as conn:
+            log_columns = {column['name'] for column in inspect(conn).get_columns('data_processing_logs')}
+            if 'mtime_ns' not in log_columns:
+                conn.execute(text("ALTER TABLE data_processing_logs ADD COLUMN mtime_ns BIGINT"))
+                logger.info("Added data_processing_logs.mtime_ns")
+            conn.execute(text(
+                "CREATE INDEX IF NOT EXISTS ix_data_processing_logs_file_stat "
+                "ON data_processing_logs (file_path, file_size, mtime_ns)"
+            ))
+            
+            # Unique natural keys for artist/track upserts - duplicates must be merged first
+            if not _has_unique_index(conn, 'artists', ['name_normalized']):
+                self._merge_duplicate_artists(conn)
+                conn.execute(text(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS uq_artists_name_normalized ON artists (name_normalized)"
+                ))
+                logger.info("Added unique index on artists.name_normalized")
+            if not _has_unique_index(conn, 'tracks', ['title_normalized', 'artist_id']):
+                self._merge_duplicate_tracks(conn)
+                conn.execute(text(
+                    "CREATE UNIQUE INDEX IF NOT EXISTS ix_tracks_title_artist ON tracks (title_normalized, artist_id)"
+                ))
+                logger.info("Added unique index on tracks (title_normalized, artist_id)")
+    
+    @staticmethod
+    def _merge_duplicate_artists(conn) -> None:
+        """Point tracks at the oldest artist per normalized name and delete the other duplicates"""
+        duplicate_ids = """
+            SELECT a.id FROM artists a
+            WHERE a.id > (SELECT MIN(b.id) FROM artists b WHERE b.name_normalized = a.name_normalized)
+        """
+        conn.execute(text(f"""
+            UPDATE tracks SET artist_id = (
+                SELECT MIN(keep.id) FROM artists keep
+                JOIN artists dup ON dup.name_normalized = keep.name_normalized
+                WHERE dup.id = tracks.artist_id
+            )
+            WHERE artist_id IN ({duplicate_ids})
+        """))
+        deleted = conn.execute(text(f"DELETE FROM artists WHERE id IN ({duplicate_ids})")).rowcount
+        if deleted:
+            logger.info(f"Merged {deleted} duplicate artists")
+    
+    @staticmethod
+    def _merge_duplicate_tracks(conn) -> None:
+        """Point streaming records at the oldest track per (normalized title, artist) and delete the other duplicates"""
+        duplicate_ids = """
+            SELECT t.id FROM tracks t
+            WHERE t.id > (
+                SELECT MIN(u.id) FROM tracks u
+                WHERE u.title_normalized = t.title_normalized AND u.artist_id = t.artist_id
+            )
+        """
+        conn.execute(text(f"""
+            UPDATE streaming_records SET track_id = (
+                SELECT MIN(keep.id) FROM tracks keep
+                JOIN tracks dup ON dup.title_normalized = keep.title_normalized AND dup.artist_id = keep.artist_id
+                WHERE dup.id = streaming_records.track_id
+            )
+            WHERE track_id IN ({duplicate_ids})
+        """))
+        # Keep an ISRC held only by a duplicate; it can move once the duplicate is gone (ISRC is unique)
+        inherited_isrcs = conn.execute(text(f"""
+            SELECT keep.id, MIN(dup.isrc) FROM tracks keep
+            JOIN tracks dup ON dup.title_normalized = keep.title_normalized AND dup.artist_id = keep.artist_id
+            WHERE keep.isrc IS NULL AND dup.isrc IS NOT NULL AND keep.id NOT IN ({duplicate_ids})
+            GROUP BY keep.id
+        """)).all()
+        deleted = conn.execute(text(f"DELETE FROM tracks WHERE id IN ({duplicate_ids})")).rowcount
+        for track_id, isrc in inherited_isrcs:
+            conn.execute(text("UPDATE tracks SET isrc = :isrc WHERE id = :id"), {'isrc': isrc, 'id': track_id})
+        if deleted:
+            logger.info(f"Merged {deleted} duplicate tracks")
+    
+    def has_natural_key_indexes(self) -> bool:
+        """Check whether the unique artist/track indexes that ON CONFLICT upserts target exist"""
+        with self.engine.connect() as conn:
+            return (
+                _has_unique_index(conn, 'artists', ['name_normalized'])
+                and _has_unique_index(conn, 'tracks', ['title_normalized', 'artist_id'])
+            )
+    
     def setup_timescaledb(self):
         """Setup TimescaleDB hypertable and optimizations"""
         if self.database_url and 'sqlite' in self.database_url.lower():
@@ -415,6 +546,7 @@ def initialize_database(database_url: str | None = None) -> DatabaseManager:
     
     # Create tables
     db.create_all_tables()
+    db.upgrade_schema()
     
     # Setup TimescaleDB (only for PostgreSQL)
     if 'postgresql' in database_url.lower():
@@ -3,17 +3,33 @@
 Updated Data Processor with correct Spotify column mappings based on real file analysis
 """
 
+import io
 import os
+import csv
+import time
+import uuid
+import fnmatch
+import hashlib
 import logging
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
 
+import numpy as np
 import pandas as pd
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql, sqlite
 from sqlalchemy.exc import IntegrityError
 
-from ..database.models import DatabaseManager, StreamingRecord, Artist, Track, Platform, QualityScore
+try:
+    import pyarrow  # noqa: F401
+    STRING_DTYPE = 'string[pyarrow]'
+except ImportError:  # pyarrow is optional - fall back to pandas' Python-backed strings
+    STRING_DTYPE = 'string'
+
+from ..database.models import json_dumps, DatabaseManager, StreamingRecord, Artist, Track, Platform, QualityScore, DataProcessingLog
 from .parsers.enhanced_parser import EnhancedETLParser
 
 logger = logging.getLogger(__name__)
@@ -27,16 +43,37 @@ class ProcessingResult:
     quality_score: float = 0.0
     processing_time: float = 0.0
     error_message: Optional[str] = None
+    skipped: bool = False
+    file_path: Optional[str] = None
+    platform: Optional[str] = None
 
 class StreamingDataProcessor:
     """
     Updated data processor with correct Spotify column mappings from real file analysis
     """
     
+    # Rows buffered before each multi-row INSERT into streaming_records
+    INSERT_BATCH_SIZE = 10000
+    
+    # Maximum values per IN (...) clause when resolving artists/tracks in bulk
+    LOOKUP_CHUNK_SIZE = 500
+    
+    # Column signatures identifying Spotify file types
+    SPOTIFY_TOPD_COLUMNS = frozenset({'artists', 'track_name', 'streams30s'})
+    SPOTIFY_PLAYLIST_COLUMNS = frozenset({'playlist_name', 'streamshare'})
+    
     def __init__(self, db_manager: DatabaseManager):
         self.db_manager = db_manager
         self.parser = EnhancedETLParser()
         
+        # Lookup caches: normalized artist name -> (id, name), (normalized title, artist_id) -> (id, title)
+        self._artist_cache: Dict[str, Tuple[int, str]] = {}
+        self._track_cache: Dict[Tuple[str, Optional[int]], Tuple[int, str]] = {}
+        self._artist_cache_warmed = False
+        
+        # Whether the unique artist/track keys ON CONFLICT needs exist (checked on first insert)
+        self._use_upserts: Optional[bool] = None
+        
         # Platform-specific column mappings - UPDATED WITH REAL COLUMN NAMES
         self.column_mappings = {
             'spo-spotify': {
@@ -71,26 +108,37 @@ class StreamingDataProcessor:
                 'isrc': ['ISRC', 'isrc'],
             }
         }
-    
-    def _find_column(self, df: pd.DataFrame, column_mappings: List[str]) -> Optional[str]:
-        """Find the actual column name from a list of possible names"""
-        df_columns_lower = {col.lower(): col for col in df.columns}
-        
-        for possible_name in column_mappings:
-            if possible_name.lower() in df_columns_lower:
-                return df_columns_lower[possible_name.lower()]
         
-        return None
+        # Inverted mappings per platform: lowercased possible name -> (standard name, priority)
+        self._reverse_column_mappings: Dict[str, Dict[str, Tuple[str, int]]] = {}
+        for platform_code, mappings in self.column_mappings.items():
+            reverse_mapping = {}
+            for standard_name, possible_names in mappings.items():
+                for priority, possible_name in enumerate(possible_names):
+                    reverse_mapping.setdefault(possible_name.lower(), (standard_name, priority))
+            self._reverse_column_mappings[platform_code] = reverse_mapping
     
     def _extract_columns(self, df: pd.DataFrame, platform_code: str) -> Dict[str, Optional[str]]:
-        """Extract the actual column names for a platform"""
-        mappings = self.column_mappings.get(platform_code, {})
-        result = {}
+        """Extract the actual column names for a platform with one pass over the DataFrame columns"""
+        reverse_mapping = self._reverse_column_mappings.get(platform_code, {})
+        matches: Dict[str, Tuple[int, str]] = {}
         
-        for standard_name, possible_names in mappings.items():
-            actual_column = self._find_column(df, possible_names)
+        for column in df.columns:
+            match = reverse_mapping.get(str(column).lower())
+            if match:
+                standard_name, priority = match
+                # Lower priority = earlier in the possible-names list; ties keep the later column
+                if standard_name not in matches or priority <= matches[standard_name][0]:
+                    matches[standard_name] = (priority, column)
+        
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        result = {}
+        for standard_name in self.column_mappings.get(platform_code, {}):
+            actual_column = matches[standard_name][1] if standard_name in matches else None
             result[standard_name] = actual_column
             
+            if not debug_enabled:
+                continue
             if actual_column:
                 logger.debug(f"Mapped {standard_name} -> {actual_column}")
             else:
@@ -100,17 +148,34 @@ class StreamingDataProcessor:
     
     def _detect_spotify_file_type(self, df: pd.DataFrame) -> str:
         """Detect the type of Spotify file based on columns"""
-        columns = [col.lower() for col in df.columns]
+        columns = frozenset(str(col).lower() for col in df.columns)
         
-        if 'artists' in columns and 'track_name' in columns and 'streams30s' in columns:
+        if self.SPOTIFY_TOPD_COLUMNS <= columns:
             return 'topd'  # Weekly track data
-        elif 'playlist_name' in columns and 'streamshare' in columns:
+        elif self.SPOTIFY_PLAYLIST_COLUMNS <= columns:
             return 'playlist'  # Monthly playlist data
         else:
             return 'unknown'
     
-    def _get_or_create_artist(self, session, artist_name: str) -> Optional[Artist]:
-        """Get existing artist or create new one"""
+    @staticmethod
+    def _normalize_string(text: str) -> str:
+        """Normalize a name for matching: surrounding whitespace stripped, lowercased"""
+        return text.strip().lower()
+    
+    def _warm_artist_cache(self, session) -> None:
+        """Load all known artists into the lookup cache with a single query"""
+        for artist_id, name, name_normalized in session.query(Artist.id, Artist.name, Artist.name_normalized):
+            self._artist_cache.setdefault(name_normalized, (artist_id, name))
+        self._artist_cache_warmed = True
+    
+    def _clear_lookup_caches(self) -> None:
+        """Drop cached artist/track IDs (e.g. after a rollback discarded new rows)"""
+        self._artist_cache.clear()
+        self._track_cache.clear()
+        self._artist_cache_warmed = False
+    
+    def _get_or_create_artist(self, session, artist_name: str) -> Optional[Tuple[int, str]]:
+        """Get existing artist or create new one, returning (artist_id, name)"""
         if not artist_name or pd.isna(artist_name):
             return None
         
@@ -120,33 +185,20 @@ class StreamingDataProcessor:
             return None
         
         # Normalize for search
-        artist_name_normalized = artist_name.lower().strip()
-        
-        # Try to find existing artist
-        artist = session.query(Artist).filter(
-            Artist.name_normalized == artist_name_normalized
-        ).first()
+        artist_name_normalized = self._normalize_string(artist_name)
         
-        if not artist:
-            # Create new artist
+        if artist_name_normalized not in self._artist_cache:
             try:
-                artist = Artist(
-                    name=artist_name,
-                    name_normalized=artist_name_normalized,
-                    metadata={}
-                )
-                session.add(artist)
-                session.flush()  # Get the ID
-                logger.debug(f"Created new artist: {artist_name} (ID: {artist.id})")
+                self._resolve_artists(session, pd.Series([artist_name]))
             except Exception as e:
                 logger.error(f"Failed to create artist {artist_name}: {e}")
                 return None
         
-        return artist
+        return self._artist_cache.get(artist_name_normalized)
     
-    def _get_or_create_track(self, session, track_title: str, artist: Optional[Artist], album_name: Optional[str] = None, isrc: Optional[str] = None) -> Optional[Track]:
-        """Get existing track or create new one"""
-        if not track_title or pd.isna(track_title):
+    def _get_or_create_track(self, session, track_title: str, artist_id: Optional[int], album_name: Optional[str] = None, isrc: Optional[str] = None) -> Optional[Tuple[int, str]]:
+        """Get existing track or create new one, returning (track_id, title)"""
+        if not track_title or pd.isna(track_title) or artist_id is None:
             return None
         
         # Clean track title
@@ -155,34 +207,226 @@ class StreamingDataProcessor:
             return None
         
         # Normalize for search
-        track_title_normalized = track_title.lower().strip()
+        cache_key = (self._normalize_string(track_title), artist_id)
         
-        # Try to find existing track
-        query = session.query(Track).filter(Track.title_normalized == track_title_normalized)
-        
-        if artist:
-            query = query.filter(Track.artist_id == artist.id)
-        
-        track = query.first()
-        
-        if not track:
-            # Create new track
+        if cache_key not in self._track_cache:
             try:
-                track = Track(
-                    title=track_title,
-                    title_normalized=track_title_normalized,
-                    album_name=album_name if album_name and not pd.isna(album_name) else None,
-                    isrc=isrc if isrc and not pd.isna(isrc) else None,
-                    artist_id=artist.id if artist else None
+                self._resolve_tracks(
+                    session,
+                    pd.Series([track_title]),
+                    pd.Series([artist_id]),
+                    pd.Series([isrc], dtype=object),
+                    pd.Series([album_name], dtype=object)
                 )
-                session.add(track)
-                session.flush()  # Get the ID
-                logger.debug(f"Created new track: {track_title} by {artist.name if artist else 'Unknown'} (ID: {track.id})")
             except Exception as e:
                 logger.error(f"Failed to create track {track_title}: {e}")
                 return None
         
-        return track
+        return self._track_cache.get(cache_key)
+    
+    def _upsert_statement(self, session, model, conflict_columns: List[str], keep_column: str):
+        """
+        Build a multi-row INSERT that leaves existing rows untouched on a natural-key conflict
+        
+        A no-op DO UPDATE (rather than DO NOTHING) lets RETURNING yield the existing rows too,
+        so concurrent workers creating the same artist/track both get its ID. Without the
+        unique natural-key indexes this falls back to a plain INSERT.
+        """
+        table = model.__table__
+        dialect_name = session.get_bind().dialect.name
+        if self._use_upserts is None:
+            self._use_upserts = self.db_manager.has_natural_key_indexes()
+            if not self._use_upserts:
+                logger.warning(
+                    "Unique artist/track indexes missing - creating artists and tracks with plain INSERTs. "
+                    "Run DatabaseManager.upgrade_schema() to enable race-safe upserts."
+                )
+        if not self._use_upserts:
+            return table.insert()
+        if dialect_name == 'postgresql':
+            statement = postgresql.insert(table)
+        elif dialect_name == 'sqlite':
+            statement = sqlite.insert(table)
+        else:
+            return table.insert()
+        return statement.on_conflict_do_update(
+            index_elements=conflict_columns,
+            set_={keep_column: table.c[keep_column]}
+        )
+    
+    @staticmethod
+    def _supports_insert_returning(session) -> bool:
+        """Check whether the dialect can return generated IDs from a multi-row INSERT"""
+        return bool(getattr(session.get_bind().dialect, 'insert_executemany_returning', False))
+    
+    def _select_artists(self, session, normalized_names: List[str]) -> None:
+        """Load artists matching the given normalized names into the cache"""
+        for i in range(0, len(normalized_names), self.LOOKUP_CHUNK_SIZE):
+            chunk = normalized_names[i:i + self.LOOKUP_CHUNK_SIZE]
+            for artist_id, name, name_normalized in session.execute(
+                select(Artist.id, Artist.name, Artist.name_normalized).where(Artist.name_normalized.in_(chunk))
+            ):
+                self._artist_cache.setdefault(name_normalized, (artist_id, name))
+    
+    def _resolve_artists(self, session, artist_names: pd.Series) -> pd.Series:
+        """
+        Resolve every artist in a file with bulk SELECT/INSERT statements
+        
+        Returns the artist ID for each row (NaN where the name is missing)
+        """
+        names = artist_names.dropna().astype(str).str.strip()
+        names = names[names != '']
+        normalized = names.str.lower()
+        
+        unique = pd.DataFrame({'name': names, 'name_normalized': normalized}).drop_duplicates('name_normalized')
+        missing = [
+            (name, name_normalized)
+            for name, name_normalized in zip(unique['name'], unique['name_normalized'])
+            if name_normalized not in self._artist_cache
+        ]
+        
+        if missing:
+            self._select_artists(session, [name_normalized for _, name_normalized in missing])
+            
+            to_create = [
+                {'name': name, 'name_normalized': name_normalized}
+                for name, name_normalized in missing
+                if name_normalized not in self._artist_cache
+            ]
+            if to_create:
+                statement = self._upsert_statement(session, Artist, ['name_normalized'], 'name')
+                if self._supports_insert_returning(session):
+                    # One multi-row INSERT ... RETURNING hands back all new IDs at once
+                    for artist_id, name, name_normalized in session.execute(
+                        statement.returning(Artist.id, Artist.name, Artist.name_normalized), to_create
+                    ):
+                        self._artist_cache[name_normalized] = (artist_id, name)
+                else:
+                    session.execute(statement, to_create)
+                    self._select_artists(session, [row['name_normalized'] for row in to_create])
+                logger.debug(f"Created {len(to_create)} new artists")
+        
+        artist_ids = normalized.map(lambda name: self._artist_cache.get(name, (None,))[0])
+        return artist_ids.reindex(artist_names.index)
+    
+    def _select_tracks(self, session, keys: set) -> None:
+        """Load tracks matching the given (normalized title, artist_id) keys into the cache"""
+        titles = sorted({title_normalized for title_normalized, _ in keys})
+        for i in range(0, len(titles), self.LOOKUP_CHUNK_SIZE):
+            chunk = titles[i:i + self.LOOKUP_CHUNK_SIZE]
+            for track_id, title, title_normalized, artist_id in session.execute(
+                select(Track.id, Track.title, Track.title_normalized, Track.artist_id).where(Track.title_normalized.in_(chunk))
+            ):
+                key = (title_normalized, artist_id)
+                if key in keys:
+                    self._track_cache.setdefault(key, (track_id, title))
+    
+    def _resolve_tracks(self, session, track_titles: pd.Series, artist_ids: pd.Series, isrcs: Optional[pd.Series] = None, album_names: Optional[pd.Series] = None) -> None:
+        """Resolve every (track, artist) pair in a file into the cache with bulk SELECT/INSERT statements"""
+        frame = pd.DataFrame({
+            'title': track_titles,
+            'artist_id': artist_ids,
+            'isrc': isrcs if isrcs is not None else None,
+            'album_name': album_names if album_names is not None else None
+        }).dropna(subset=['title', 'artist_id'])
+        frame['title'] = frame['title'].astype(str).str.strip()
+        frame = frame[frame['title'] != '']
+        frame['title_normalized'] = frame['title'].str.lower()
+        frame['artist_id'] = frame['artist_id'].astype(int)
+        for optional_column in ('isrc', 'album_name'):
+            frame[optional_column] = frame[optional_column].astype(object).where(frame[optional_column].notna(), None)
+        
+        unique = frame.drop_duplicates(['title_normalized', 'artist_id'])
+        missing = [
+            row for row in unique.itertuples(index=False)
+            if (row.title_normalized, row.artist_id) not in self._track_cache
+        ]
+        if not missing:
+            return
+        
+        keys = {(row.title_normalized, row.artist_id) for row in missing}
+        self._select_tracks(session, keys)
+        
+        to_create = [
+            {
+                'title': row.title,
+                'title_normalized': row.title_normalized,
+                'artist_id': row.artist_id,
+                'album_name': row.album_name or None,
+                'isrc': row.isrc or None
+            }
+            for row in missing
+            if (row.title_normalized, row.artist_id) not in self._track_cache
+        ]
+        if not to_create:
+            return
+        
+        # ISRC is unique - drop codes that are already stored or repeated within this batch
+        isrc_values = sorted({row['isrc'] for row in to_create if row['isrc']})
+        taken = set()
+        for i in range(0, len(isrc_values), self.LOOKUP_CHUNK_SIZE):
+            chunk = isrc_values[i:i + self.LOOKUP_CHUNK_SIZE]
+            taken.update(isrc for (isrc,) in session.execute(select(Track.isrc).where(Track.isrc.in_(chunk))))
+        for row in to_create:
+            if row['isrc'] in taken:
+                row['isrc'] = None
+            elif row['isrc']:
+                taken.add(row['isrc'])
+        
+        statement = self._upsert_statement(session, Track, ['title_normalized', 'artist_id'], 'title')
+        if self._supports_insert_returning(session):
+            for track_id, title, title_normalized, artist_id in session.execute(
+                statement.returning(Track.id, Track.title, Track.title_normalized, Track.artist_id), to_create
+            ):
+                self._track_cache[(title_normalized, artist_id)] = (track_id, title)
+        else:
+            session.execute(statement, to_create)
+            self._select_tracks(session, {(row['title_normalized'], row['artist_id']) for row in to_create})
+        logger.debug(f"Created {len(to_create)} new tracks")
+    
+    def _clean_metric_values(self, series: pd.Series) -> np.ndarray:
+        """Coerce a metric column to non-negative floats in one vectorized pass (invalid -> 0)"""
+        values = pd.to_numeric(series.astype(str).str.replace(',', '', regex=False), errors='coerce').to_numpy(dtype=np.float64)
+        return np.where(np.isnan(values) | (values < 0), 0.0, values)
+    
+    def _insert_streaming_records(self, session, rows: List[Dict[str, Any]]) -> None:
+        """Insert buffered streaming record rows with a single executemany (COPY on PostgreSQL)"""
+        if not rows:
+            return
+        
+        dialect = session.get_bind().dialect
+        if dialect.name == 'postgresql' and dialect.driver == 'psycopg2':
+            self._copy_streaming_records(session, rows)
+        else:
+            session.execute(StreamingRecord.__table__.insert(), rows)
+    
+    def _copy_streaming_records(self, session, rows: List[Dict[str, Any]]) -> None:
+        """Stream rows into streaming_records with PostgreSQL COPY FROM STDIN"""
+        # COPY bypasses column defaults, so fill in the ones the model generates
+        timestamp = datetime.utcnow()
+        columns = ['id', 'created_at', 'updated_at'] + list(rows[0].keys())
+        
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in rows:
+            values = [str(uuid.uuid4()), timestamp, timestamp]
+            for column in columns[3:]:
+                value = row.get(column)
+                if column == 'user_demographic' and value is not None:
+                    value = json_dumps(value)
+                values.append(value)
+            writer.writerow(values)
+        buffer.seek(0)
+        
+        # Runs on the session's own connection, so it shares the open transaction
+        cursor = session.connection().connection.cursor()
+        try:
+            cursor.copy_expert(
+                f"COPY {StreamingRecord.__tablename__} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)",
+                buffer
+            )
+        finally:
+            cursor.close()
     
     def _process_spotify_playlist_data(self, df: pd.DataFrame, platform_id: int, file_path: str, session) -> tuple[int, int]:
         """Process Spotify playlist data (MSED/MSEN files)"""
@@ -191,66 +435,89 @@ class StreamingDataProcessor:
         
         logger.info(f"Processing {len(df)} playlist records from {file_path}")
         
-        for index, row in df.iterrows():
+        rows_buffer: List[Dict[str, Any]] = []
+        
+        # Per-file invariants, computed once rather than per row
+        source_name = os.path.basename(file_path)
+        processing_timestamp = datetime.utcnow()
+        record_date = datetime.now().date()  # Use current date for playlist data
+        
+        # Use the shared "playlist" artist and a track per playlist
+        playlist_artist = self._get_or_create_artist(session, "Playlist Data")
+        if not playlist_artist:
+            logger.warning(f"Failed to get/create the playlist artist for {file_path}")
+            return 0, len(df)
+        playlist_artist_id, playlist_artist_name = playlist_artist
+        
+        # Drop rows without a playlist name in one pass
+        playlist_names = df['playlist_name'].astype(STRING_DTYPE).str.strip()
+        has_name = playlist_names.fillna('').ne('')
+        missing_names = int((~has_name).sum())
+        if missing_names:
+            logger.debug(f"Skipping {missing_names} rows: missing playlist_name")
+            records_failed += missing_names
+        
+        # Convert streamshare to numeric for the whole column; missing or invalid values become 0
+        streamshares = pd.to_numeric(df['streamshare'].astype(str).str.strip(), errors='coerce').fillna(0.0)
+        playlists = pd.DataFrame({
+            'playlist_name': playlist_names,
+            'playlist_key': playlist_names.str.lower(),
+            'streamshare': streamshares
+        }, index=df.index)[has_name]
+        
+        # Resolve all playlist "tracks" in bulk under the shared playlist artist
+        self._resolve_tracks(session, playlists['playlist_name'], pd.Series(playlist_artist_id, index=playlists.index))
+        
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        for row in playlists.itertuples():
+            index = row.Index
             try:
-                playlist_name = row.get('playlist_name', '')
-                streamshare = row.get('streamshare', 0)
-                
-                if not playlist_name or pd.isna(playlist_name):
-                    logger.debug(f"Skipping row {index}: missing playlist_name")
-                    records_failed += 1
-                    continue
-                
-                # Convert streamshare to numeric
-                try:
-                    if streamshare is not None and not pd.isna(streamshare):
-                        streamshare = float(str(streamshare))
-                    else:
-                        streamshare = 0.0
-                except (ValueError, TypeError):
-                    streamshare = 0.0
-                
-                # Create a "playlist" artist and track for playlist data
-                playlist_artist = self._get_or_create_artist(session, "Playlist Data")
-                if not playlist_artist:
-                    records_failed += 1
-                    continue
+                playlist_name = row.playlist_name
+                streamshare = float(row.streamshare)
                 
-                playlist_track = self._get_or_create_track(session, playlist_name, playlist_artist)
+                playlist_track = (
+                    self._track_cache.get((row.playlist_key, playlist_artist_id))
+                    or self._get_or_create_track(session, playlist_name, playlist_artist_id)
+                )
                 if not playlist_track:
                     records_failed += 1
                     continue
+                playlist_track_id, playlist_track_title = playlist_track
                 
-                # Create streaming record for playlist data
-                streaming_record = StreamingRecord(
-                    date=datetime.now().date(),  # Use current date for playlist data
-                    platform_id=platform_id,
-                    track_id=playlist_track.id,
-                    artist_name=playlist_artist.name,
-                    track_title=playlist_track.title,
-                    album_name=None,
-                    metric_type='playlist_share',  # Different metric type for playlist data
-                    metric_value=streamshare,
-                    geography=None,
-                    device_type=None,
-                    subscription_type=None,
-                    raw_data_source=os.path.basename(file_path),
-                    data_quality_score=85.0,  # Lower score for playlist data
-                    processing_timestamp=datetime.utcnow()
-                )
-                
-                session.add(streaming_record)
+                # Buffer streaming record for playlist data
+                rows_buffer.append({
+                    'date': record_date,
+                    'platform_id': platform_id,
+                    'track_id': playlist_track_id,
+                    'artist_name': playlist_artist_name,
+                    'track_title': playlist_track_title,
+                    'album_name': None,
+                    'metric_type': 'playlist_share',  # Different metric type for playlist data
+                    'metric_value': streamshare,
+                    'geography': None,
+                    'device_type': None,
+                    'subscription_type': None,
+                    'raw_data_source': source_name,
+                    'data_quality_score': 85.0,  # Lower score for playlist data
+                    'processing_timestamp': processing_timestamp
+                })
                 records_processed += 1
-                
-                # Commit in batches
-                if records_processed % 50 == 0:
-                    session.commit()
-                    logger.debug(f"Committed batch at {records_processed} records")
             
             except Exception as e:
                 logger.error(f"Failed to process playlist row {index}: {e}")
                 records_failed += 1
                 continue
+            
+            # Insert and commit in batches; a failed batch is not a row error, so it propagates
+            # to _process_dataframe, which rolls back and fails the file
+            if len(rows_buffer) >= self.INSERT_BATCH_SIZE:
+                self._insert_streaming_records(session, rows_buffer)
+                rows_buffer.clear()
+                session.commit()
+                if debug_enabled:
+                    logger.debug(f"Committed batch at {records_processed} records")
+        
+        self._insert_streaming_records(session, rows_buffer)
         
         return records_processed, records_failed
     
@@ -261,126 +528,159 @@ class StreamingDataProcessor:
         
         logger.info(f"Processing {len(df)} track records from {file_path}")
         
-        for index, row in df.iterrows():
+        rows_buffer: List[Dict[str, Any]] = []
+        
+        # Per-file invariants, computed once rather than per row
+        source_name = os.path.basename(file_path)
+        processing_timestamp = datetime.utcnow()
+        
+        # Work on a frame holding only the mapped columns, renamed to their standard names
+        work = pd.DataFrame(
+            {std_name: df[column] for std_name, column in column_map.items() if column},
+            index=df.index
+        )
+        has_demographics = bool(column_map.get('user_demographic'))
+        if has_demographics:
+            for demographic_column in ('age_bucket', 'gender'):
+                if demographic_column in df.columns:
+                    work[demographic_column] = df[demographic_column]
+        
+        # Normalize text columns once and drop rows missing essential data in one pass
+        for text_column in ('artist_name', 'track_title'):
+            if text_column in work.columns:
+                work[text_column] = work[text_column].astype(STRING_DTYPE).str.strip()
+            else:
+                work[text_column] = pd.Series(pd.NA, index=work.index, dtype=STRING_DTYPE)
+        
+        has_essentials = work['artist_name'].fillna('').ne('') & work['track_title'].fillna('').ne('')
+        missing_essentials = int((~has_essentials).sum())
+        if missing_essentials:
+            logger.debug(f"Skipping {missing_essentials} rows: missing artist_name or track_title")
+            records_failed += missing_essentials
+            work = work[has_essentials]
+        
+        work['artist_key'] = work['artist_name'].str.lower()
+        work['title_key'] = work['track_title'].str.lower()
+        
+        # Resolve all artists and tracks for the file in bulk; the row loop then hits the cache
+        artist_ids = self._resolve_artists(session, work['artist_name'])
+        self._resolve_tracks(session, work['track_title'], artist_ids, work.get('isrc'))
+        
+        # Clean the whole metric column up front rather than per row
+        if 'metric_value' in work.columns:
+            work['metric_value'] = self._clean_metric_values(work['metric_value'])
+        
+        # Parse the whole date column at once; missing or unparseable dates fall back to today
+        today = datetime.now().date()
+        if 'date' in work.columns:
+            try:
+                parsed_dates = pd.to_datetime(work['date'], errors='coerce', format='mixed')
+            except ValueError:  # tz-aware datetimes with differing UTC offsets
+                parsed_dates = pd.Series(pd.NaT, index=work.index, dtype='datetime64[ns]')
+            record_dates = parsed_dates.dt.date.astype(object).where(parsed_dates.notna(), None)
+            
+            # Datetimes pandas can't hold in one column (differing UTC offsets) keep their own local date
+            missed = parsed_dates.isna()
+            if missed.any():
+                record_dates[missed] = work['date'][missed].map(
+                    lambda value: value.date() if isinstance(value, datetime) else None
+                )
+            
+            unparsed = record_dates.isna() & work['date'].astype(STRING_DTYPE).str.strip().fillna('').ne('')
+            if unparsed.any():
+                logger.warning(f"Could not parse {int(unparsed.sum())} dates, e.g. {work['date'][unparsed].iloc[0]}")
+            work['date'] = record_dates.where(record_dates.notna(), today)
+        else:
+            work['date'] = today
+        
+        # Give every optional field a column so the loop reads plain attributes
+        if 'metric_value' not in work.columns:
+            work['metric_value'] = 0.0
+        optional_columns = ('isrc', 'geography', 'age_bucket', 'gender') if has_demographics else ('isrc', 'geography')
+        for optional_column in optional_columns:
+            if optional_column not in work.columns:
+                work[optional_column] = None
+        
+        # Build demographic payloads up front; the JSON column type serializes them
+        if has_demographics:
+            demographics = work[['age_bucket', 'gender']].astype(STRING_DTYPE).apply(lambda column: column.str.strip())
+            demographics = demographics.replace('', pd.NA)
+            work['user_demographic'] = [
+                {key: value for key, value in record.items() if pd.notna(value)} or None
+                for record in demographics.to_dict('records')
+            ]
+        else:
+            work['user_demographic'] = None
+        
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
+        for row in work.itertuples():
+            index = row.Index
             try:
                 # Extract basic data using column mappings
-                artist_name = None
-                if column_map.get('artist_name'):
-                    artist_name = row.get(column_map['artist_name'])
-                
-                track_title = None
-                if column_map.get('track_title'):
-                    track_title = row.get(column_map['track_title'])
-                
-                metric_value = None
-                if column_map.get('metric_value'):
-                    metric_value = row.get(column_map['metric_value'])
-                    # Convert to numeric
-                    try:
-                        if metric_value is not None and not pd.isna(metric_value):
-                            metric_value = float(str(metric_value).replace(',', ''))
-                    except (ValueError, TypeError):
-                        metric_value = 0.0
-                
-                # Skip rows without essential data
-                if not artist_name or not track_title or pd.isna(artist_name) or pd.isna(track_title):
-                    logger.debug(f"Skipping row {index}: missing artist_name or track_title")
-                    records_failed += 1
-                    continue
+                artist_name = row.artist_name
+                track_title = row.track_title
                 
-                # Get or create artist
-                artist = self._get_or_create_artist(session, artist_name)
+                # Get or create artist (normally a cache hit after the bulk resolve)
+                artist = self._artist_cache.get(row.artist_key) or self._get_or_create_artist(session, artist_name)
                 if not artist:
                     logger.warning(f"Failed to get/create artist for row {index}: {artist_name}")
                     records_failed += 1
                     continue
                 
-                # Get additional fields
-                isrc = None
-                if column_map.get('isrc'):
-                    isrc = row.get(column_map['isrc'])
+                artist_id, artist_display_name = artist
                 
                 # Get or create track
-                track = self._get_or_create_track(session, track_title, artist, None, isrc)
+                track = (
+                    self._track_cache.get((row.title_key, artist_id))
+                    or self._get_or_create_track(session, track_title, artist_id, None, row.isrc)
+                )
                 if not track:
                     logger.warning(f"Failed to get/create track for row {index}: {track_title}")
                     records_failed += 1
                     continue
+                track_id, track_display_title = track
                 
-                # Extract date
-                date_value = None
-                if column_map.get('date'):
-                    date_raw = row.get(column_map['date'])
-                    if date_raw and not pd.isna(date_raw):
-                        try:
-                            if isinstance(date_raw, str):
-                                from dateutil import parser as date_parser
-                                date_value = date_parser.parse(date_raw).date()
-                            else:
-                                date_value = pd.to_datetime(date_raw).date()
-                        except:
-                            logger.warning(f"Could not parse date: {date_raw}")
-                            date_value = datetime.now().date()
-                    else:
-                        date_value = datetime.now().date()
-                else:
-                    date_value = datetime.now().date()
-                
-                # Extract other fields
-                geography = None
-                if column_map.get('geography'):
-                    geography = row.get(column_map['geography'])
-                
-                # Create user demographic info if available
-                user_demographic = {}
-                if column_map.get('user_demographic'):
-                    # Handle age_bucket and gender
-                    age_bucket = row.get('age_bucket')
-                    gender = row.get('gender')
-                    if age_bucket and not pd.isna(age_bucket):
-                        user_demographic['age_bucket'] = str(age_bucket)
-                    if gender and not pd.isna(gender):
-                        user_demographic['gender'] = str(gender)
-                
-                user_demographic_str = str(user_demographic) if user_demographic else None
-                
-                # Create streaming record
-                streaming_record = StreamingRecord(
-                    date=date_value,
-                    platform_id=platform_id,
-                    track_id=track.id,
-                    artist_name=artist.name,
-                    track_title=track.title,
-                    album_name=None,
-                    metric_type='streams',
-                    metric_value=metric_value or 0.0,
-                    geography=geography,
-                    device_type=None,
-                    subscription_type=None,
-                    user_demographic=user_demographic_str,
-                    raw_data_source=os.path.basename(file_path),
-                    data_quality_score=95.0,
-                    processing_timestamp=datetime.utcnow()
-                )
-                
-                session.add(streaming_record)
+                # Buffer streaming record
+                rows_buffer.append({
+                    'date': row.date,
+                    'platform_id': platform_id,
+                    'track_id': track_id,
+                    'artist_name': artist_display_name,
+                    'track_title': track_display_title,
+                    'album_name': None,
+                    'metric_type': 'streams',
+                    'metric_value': float(row.metric_value),
+                    'geography': row.geography,
+                    'device_type': None,
+                    'subscription_type': None,
+                    'user_demographic': row.user_demographic,
+                    'raw_data_source': source_name,
+                    'data_quality_score': 95.0,
+                    'processing_timestamp': processing_timestamp
+                })
                 records_processed += 1
-                
-                # Commit in batches
-                if records_processed % 100 == 0:
-                    session.commit()
-                    logger.debug(f"Committed batch at {records_processed} records")
             
             except Exception as e:
                 logger.error(f"Failed to process track row {index}: {e}")
                 records_failed += 1
                 continue
+            
+            # Insert and commit in batches; a failed batch is not a row error, so it propagates
+            # to _process_dataframe, which rolls back and fails the file
+            if len(rows_buffer) >= self.INSERT_BATCH_SIZE:
+                self._insert_streaming_records(session, rows_buffer)
+                rows_buffer.clear()
+                session.commit()
+                if debug_enabled:
+                    logger.debug(f"Committed batch at {records_processed} records")
+        
+        self._insert_streaming_records(session, rows_buffer)
         
         return records_processed, records_failed
     
     def _process_dataframe(self, df: pd.DataFrame, platform_code: str, file_path: str) -> ProcessingResult:
         """Process a parsed DataFrame into database records"""
-        start_time = datetime.now()
+        start_ns = time.perf_counter_ns()
         
         try:
             with self.db_manager.get_session() as session:
@@ -393,6 +693,9 @@ class StreamingDataProcessor:
                         error_message=f"Platform {platform_code} not found in database"
                     )
                 
+                if not self._artist_cache_warmed:
+                    self._warm_artist_cache(session)
+                
                 # For Spotify, detect file type and handle accordingly
                 if platform_code == 'spo-spotify':
                     spotify_file_type = self._detect_spotify_file_type(df)
@@ -424,7 +727,7 @@ class StreamingDataProcessor:
                 # Final commit
                 session.commit()
                 
-                processing_time = (datetime.now() - start_time).total_seconds()
+                processing_time = (time.perf_counter_ns() - start_ns) / 1e9
                 
                 logger.info(f"Successfully processed {records_processed} records in {processing_time:.2f}s")
                 
@@ -437,7 +740,9 @@ class StreamingDataProcessor:
                 )
                 
         except Exception as e:
-            processing_time = (datetime.now() - start_time).total_seconds()
+            # Uncommitted artists/tracks were rolled back, so their cached IDs are stale
+            self._clear_lookup_caches()
+            processing_time = (time.perf_counter_ns() - start_ns) / 1e9
             logger.error(f"Processing failed: {e}")
             return ProcessingResult(
                 success=False,
@@ -446,15 +751,102 @@ class StreamingDataProcessor:
                 records_failed=len(df) if df is not None else 0
             )
     
-    def process_file(self, file_path: str) -> ProcessingResult:
-        """Process a single file"""
+    def _calculate_file_hash(self, file_path: Path) -> str:
+        """Calculate SHA-256 hash of file contents"""
+        sha256 = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b''):
+                sha256.update(chunk)
+        return sha256.hexdigest()
+    
+    def _is_file_unchanged(self, session, file_path: Path, stat: os.stat_result) -> bool:
+        """Check whether this exact (path, size, mtime) was already processed successfully"""
+        return session.execute(
+            select(DataProcessingLog.id).where(
+                DataProcessingLog.file_path == str(file_path),
+                DataProcessingLog.file_size == stat.st_size,
+                DataProcessingLog.mtime_ns == stat.st_mtime_ns,
+                DataProcessingLog.processing_status == "completed"
+            ).limit(1)
+        ).first() is not None
+    
+    def _is_file_processed(self, session, file_hash: str) -> bool:
+        """Check whether a file with this content hash was already processed successfully"""
+        return session.execute(
+            select(DataProcessingLog.id).where(
+                DataProcessingLog.file_hash == file_hash,
+                DataProcessingLog.processing_status == "completed"
+            ).limit(1)
+        ).first() is not None
+    
+    def _log_processing_result(self, file_path: Path, stat: os.stat_result, file_hash: str,
+                               platform_code: str, result: ProcessingResult) -> None:
+        """Record the outcome of processing a file in the audit log"""
+        try:
+            with self.db_manager.get_session() as session:
+                platform = session.query(Platform).filter(Platform.code == platform_code).first()
+                if not platform:
+                    logger.warning(f"Not logging result for {file_path}: platform {platform_code} not found")
+                    return
+                
+                session.add(DataProcessingLog(
+                    file_path=str(file_path),
+                    file_name=file_path.name,
+                    file_size=stat.st_size,
+                    mtime_ns=stat.st_mtime_ns,
+                    file_hash=file_hash,
+                    platform_id=platform.id,
+                    processing_status="completed" if result.success else "failed",
+                    records_processed=result.records_processed,
+                    records_failed=result.records_failed,
+                    quality_score=result.quality_score,
+                    error_message=result.error_message,
+                    completed_at=datetime.utcnow(),
+                    processing_duration_ms=int(result.processing_time * 1000)
+                ))
+                session.commit()
+        except Exception as e:
+            logger.error(f"Failed to log processing result for {file_path}: {e}")
+    
+    def process_file(self, file_path: str, processed_hashes: Optional[set] = None) -> ProcessingResult:
+        """
+        Process a single file
+        
+        processed_hashes: preloaded hashes of completed files (from process_directory);
+        when None, the processing log is queried directly
+        """
         logger.info(f"Processing file: {file_path}")
         
         try:
-            file_path_obj = Path(file_path)
+            file_path_obj = Path(file_path).resolve()
+            stat = file_path_obj.stat()
+            
+            # Cheap (path, size, mtime) check first - only hash the file when that misses
+            with self.db_manager.get_session() as session:
+                if self._is_file_unchanged(session, file_path_obj, stat):
+                    logger.info(f"Skipping unchanged file: {file_path}")
+                    return ProcessingResult(success=True, skipped=True)
+                
+                file_hash = self._calculate_file_hash(file_path_obj)
+                if processed_hashes is not None:
+                    already_processed = file_hash in processed_hashes
+                else:
+                    already_processed = self._is_file_processed(session, file_hash)
+                
+                if already_processed:
+                    logger.info(f"Skipping already processed file: {file_path}")
+                    return ProcessingResult(success=True, skipped=True)
+            
+            # Detect platform once and hand it to the parser
+            platform_code = self.parser.detect_platform(file_path_obj)
+            if not platform_code:
+                return ProcessingResult(
+                    success=False,
+                    error_message="Could not detect platform from file path"
+                )
             
             # Parse the file
-            parse_result = self.parser.parse_file(file_path_obj)
+            parse_result = self.parser.parse_file(file_path_obj, platform=platform_code)
             
             if not parse_result.success:
                 return ProcessingResult(
@@ -468,14 +860,6 @@ class StreamingDataProcessor:
                     error_message="No data found in file"
                 )
             
-            # Detect platform
-            platform_code = self.parser.detect_platform(file_path_obj)
-            if not platform_code:
-                return ProcessingResult(
-                    success=False,
-                    error_message="Could not detect platform from file path"
-                )
-            
             logger.info(f"Detected platform: {platform_code}")
             logger.info(f"Data shape: {parse_result.data.shape}")
             logger.info(f"Columns: {list(parse_result.data.columns)}")
@@ -484,8 +868,13 @@ class StreamingDataProcessor:
             result = self._process_dataframe(parse_result.data, platform_code, file_path)
             
             # Update quality score from parsing
+            result.platform = platform_code
             if result.success:
                 result.quality_score = parse_result.quality_score
+                if processed_hashes is not None:
+                    processed_hashes.add(file_hash)
+            
+            self._log_processing_result(file_path_obj, stat, file_hash, platform_code, result)
             
             return result
             
@@ -495,6 +884,97 @@ class StreamingDataProcessor:
                 success=False,
                 error_message=str(e)
             )
+    
+    def process_directory(self, directory_path: Path, file_pattern: str = "*") -> List[ProcessingResult]:
+        """Process all matching files in a directory, skipping already processed ones"""
+        directory_path = Path(directory_path)
+        if '/' in file_pattern or '**' in file_pattern:
+            matching_files = sorted(p for p in directory_path.glob(file_pattern) if p.is_file())
+        else:
+            # scandir entries carry the file type from the directory listing, so no extra stat per file
+            with os.scandir(directory_path) as entries:
+                matching_files = sorted(
+                    Path(entry.path) for entry in entries
+                    if entry.is_file() and fnmatch.fnmatch(entry.name, file_pattern)
+                )
+        
+        logger.info(f"Found {len(matching_files)} files in {directory_path}")
+        
+        # Load completed hashes once rather than querying the log per file
+        with self.db_manager.get_session() as session:
+            processed = {
+                h for (h,) in session.query(DataProcessingLog.file_hash).filter_by(processing_status="completed")
+            }
+        
+        results = []
+        for file_path in matching_files:
+            result = self.process_file(str(file_path), processed_hashes=processed)
+            result.file_path = str(file_path)
+            results.append(result)
+        
+        successful = sum(1 for r in results if r.success)
+        logger.info(f"Directory processing complete: {successful}/{len(results)} files succeeded")
+        
+        return results
+
+    def process_files(self, file_paths: List[str], max_workers: Optional[int] = None) -> List[ProcessingResult]:
+        """
+        Process independent files in parallel worker processes
+        
+        Each worker builds its own DatabaseManager, so no connections are shared
+        across processes. SQLite allows a single writer, so it is processed
+        sequentially in this process instead.
+        """
+        file_paths = [str(file_path) for file_path in file_paths]
+        max_workers = max_workers or os.cpu_count() or 1
+        
+        if max_workers <= 1 or len(file_paths) <= 1 or 'sqlite' in self.db_manager.database_url.lower():
+            results = []
+            for file_path in file_paths:
+                result = self.process_file(file_path)
+                result.file_path = file_path
+                results.append(result)
+            return results
+        
+        workers = min(max_workers, len(file_paths))
+        logger.info(f"Processing {len(file_paths)} files with {workers} worker processes")
+        
+        results = []
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker_processor,
+            initargs=(self.db_manager.database_url,)
+        ) as executor:
+            futures = [executor.submit(_process_file_in_worker, file_path) for file_path in file_paths]
+            for file_path, future in zip(file_paths, futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.error(f"Worker failed processing {file_path}: {e}")
+                    result = ProcessingResult(success=False, error_message=str(e))
+                result.file_path = file_path
+                results.append(result)
+        
+        successful = sum(1 for r in results if r.success)
+        logger.info(f"Parallel processing complete: {successful}/{len(results)} files succeeded")
+        
+        return results
+
+
+# Per-process state for process_files workers
+_worker_processor: Optional[StreamingDataProcessor] = None
+
+
+def _init_worker_processor(database_url: str) -> None:
+    """Create the worker process's own database connection pool and processor"""
+    global _worker_processor
+    _worker_processor = StreamingDataProcessor(DatabaseManager(database_url))
+
+
+def _process_file_in_worker(file_path: str) -> ProcessingResult:
+    """Process one file in a worker process"""
+    return _worker_processor.process_file(file_path)
+
 
 # Keep the existing process_file function for backward compatibility
 def process_file(file_path: str, db_manager: DatabaseManager = None) -> ProcessingResult:
@@ -13,23 +13,77 @@ Key fixes:
 
 import csv
 import io
+import codecs
+import os
 import re
-import chardet
+import json
+import hashlib
 import logging
-from datetime import datetime
+import sys
+import warnings
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from dataclasses import dataclass
 from enum import Enum
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Iterator, Union
 
+import numpy as np
 import pandas as pd
-from dateutil import parser as date_parser
+
+try:
+    import cchardet as chardet  # C implementation with the same detect/UniversalDetector API
+except ImportError:  # cchardet is optional - fall back to pure-Python chardet
+    import chardet
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    from pyarrow import parquet as pq
+except ImportError:  # pyarrow is optional - fall back to pandas' C parser
+    pa = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
+# pandas' default NA markers, so the Arrow CSV reader nulls the same cells as read_csv
+CSV_NA_VALUES = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan', '1.#IND', '1.#QNAN',
+    '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None', 'n/a', 'nan', 'null',
+]
+
+# Apple pre-pass: surrounding whitespace on every line, then the outer quotes of wrapped lines
+LINE_PADDING = re.compile(r'^[^\S\n]+|[^\S\n]+$', re.MULTILINE)
+QUOTE_WRAPPED_LINE = re.compile(r'^"(.*)"$', re.MULTILINE)
+
+# Byte-level versions for raw file contents in encodings where quotes, tabs and
+# line breaks are always single ASCII bytes
+LINE_PADDING_BYTES = re.compile(rb'^[^\S\n]+|[^\S\n]+$', re.MULTILINE)
+QUOTE_WRAPPED_LINE_BYTES = re.compile(rb'^"(.*)"$', re.MULTILINE)
+UNWRAPPED_LINE_BYTES = re.compile(rb'^(?:[^"\n]|"$|"[^\n]*[^"\n]$)', re.MULTILINE)
+LONE_CARRIAGE_RETURN = re.compile(rb'\r(?!\n)')
+ASCII_COMPATIBLE_ENCODINGS = {'utf-8', 'ascii', 'cp1252', 'iso8859-1'}
+PARQUET_SUFFIXES = ('.parquet', '.pq')
+
+# Generic date-ish column names, minus duration-style columns that merely mention time
+DATE_KEYWORD_COLUMN = re.compile(r'date|time|timestamp')
+NON_DATE_TIME_COLUMN = re.compile(r'watch_time|duration|seconds|minutes')
+
+# Shape of the strings each strptime format can accept, so values are only
+# handed to formats that could possibly parse them
+DATE_FORMAT_SHAPES = {
+    "%Y-%m-%d": r"\d{4}-\d{1,2}-\d{1,2}",
+    "%m/%d/%y": r"\d{1,2}/\d{1,2}/\d{2}",
+    "%Y-%m-%d %H:%M:%S": r"\d{4}-\d{1,2}-\d{1,2} \d{1,2}:\d{1,2}:\d{1,2}",
+    "%Y-%m-%d %H:%M:%S.%f%z": r"\d{4}-\d{1,2}-\d{1,2} \d{1,2}:\d{1,2}:\d{1,2}\.\d{1,6}(?:Z|[+-]\d{2}(?::?\d{2}(?::?\d{2}(?:\.\d{1,6})?)?)?)",
+    "%d/%m/%Y": r"\d{1,2}/\d{1,2}/\d{4}",
+    "%Y%m%d": r"\d{6,8}",
+    "%m/%d/%Y": r"\d{1,2}/\d{1,2}/\d{4}",
+    "ISO8601": r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}(?::\d{2}(?:\.\d{1,6})?)?",  # timezone-naive 'T' timestamps
+}
+
+
 class PlatformCode(Enum):
     """Platform codes from real data analysis"""
     APPLE = "apl-apple"
@@ -43,7 +97,11 @@ class PlatformCode(Enum):
     VEVO = "vvo-vevo"
 
 
-@dataclass
+# __slots__ instances (no per-object __dict__) where dataclasses support it (3.10+)
+DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class ParseResult:
     """Result from parsing operation"""
     success: bool
@@ -61,8 +119,31 @@ class EnhancedETLParser:
     Enhanced parser that handles real-world streaming data format inconsistencies - FIXED
     """
     
-    def __init__(self):
-        self.date_formats = [
+    # Leading bytes examined when detecting a file's encoding
+    ENCODING_SAMPLE_SIZE = 100000
+    
+    # Rows per DataFrame yielded by parse_file_chunks
+    CHUNK_SIZE = 500000
+    
+    # Path substrings per platform, checked in this order
+    PLATFORM_PATH_PATTERNS = {
+        PlatformCode.APPLE.value: ['apple', 'apl-apple', 'itunes'],
+        PlatformCode.FACEBOOK.value: ['facebook', 'fbk-facebook', 'meta'],
+        PlatformCode.SOUNDCLOUD.value: ['soundcloud', 'scu-soundcloud'],
+        PlatformCode.SPOTIFY.value: ['spotify', 'spo-spotify'],
+        PlatformCode.BOOMPLAY.value: ['boomplay', 'boo-boomplay'],
+        PlatformCode.AWA.value: ['awa', 'awa-awa'],
+        PlatformCode.VEVO.value: ['vevo', 'vvo-vevo'],
+        PlatformCode.PELOTON.value: ['peloton', 'plt-peloton'],
+        PlatformCode.DEEZER.value: ['deezer', 'dzr-deezer'],
+    }
+    
+    def __init__(self, cache_dir: Optional[str] = None):
+        # Optional on-disk Parquet cache of parsed files (needs pyarrow)
+        cache_dir = cache_dir or os.getenv('ETL_PARSE_CACHE_DIR')
+        self.cache_dir = Path(cache_dir) if cache_dir and pa is not None else None
+        
+        self.date_formats = (
             "%Y-%m-%d",           # Standard ISO: 2024-12-01
             "%m/%d/%y",           # Apple short: 12/01/24  
             "%Y-%m-%d %H:%M:%S",  # With time: 2024-12-01 17:18:10
@@ -70,9 +151,28 @@ class EnhancedETLParser:
             "%d/%m/%Y",           # Boomplay European: 01/12/2024
             "%Y%m%d",             # AWA compact: 20241201
             "%m/%d/%Y",           # US format: 12/01/2024
-        ]
+        )
+        self._date_format_patterns = {fmt: re.compile(shape) for fmt, shape in DATE_FORMAT_SHAPES.items()}
+        self._date_format_order: Dict[str, tuple] = {}
         
         self.platform_configs = self._load_platform_configs()
+        
+        # One regex per platform matching any of its configured date column names
+        self._date_column_matchers = {
+            platform: re.compile('|'.join(re.escape(col.lower()) for col in config['date_columns']))
+            for platform, config in self.platform_configs.items()
+            if config.get('date_columns')
+        }
+        
+        # Single regex over all path patterns; the lookahead reports overlapping matches
+        # so the highest-priority platform can be picked from one scan
+        self._platform_priority = {}
+        for priority, (platform, patterns) in enumerate(self.PLATFORM_PATH_PATTERNS.items()):
+            for pattern in patterns:
+                self._platform_priority.setdefault(pattern, (priority, platform))
+        alternation = '|'.join(re.escape(pattern) for pattern in self._platform_priority)
+        self._platform_regex = re.compile(f'(?=({alternation}))')
+        self._platform_cache: Dict[str, Optional[str]] = {}
     
     def _load_platform_configs(self) -> Dict[str, Dict[str, Any]]:
         """Load platform-specific parsing configurations"""
@@ -87,11 +187,13 @@ class EnhancedETLParser:
             },
             PlatformCode.FACEBOOK.value: {
                 "delimiter": ",",
-                "quoting": csv.QUOTE_ALL,
+                "quoting": csv.QUOTE_MINIMAL,  # QUOTE_ALL is a writer setting; reading only needs the quotechar
+                "quotechar": '"',
                 "encoding_priority": ["utf-8", "cp1252"],
                 "date_columns": ["date"],
                 "expected_columns": ["isrc", "date", "product_type"],
                 "numeric_columns": ["plays", "interactions"],
+                "categorical_columns": ["product_type", "territory"],
             },
             PlatformCode.SOUNDCLOUD.value: {
                 "delimiter": "\t",
@@ -107,6 +209,7 @@ class EnhancedETLParser:
                 "date_format": "%d/%m/%Y",  # European format
                 "expected_columns": ["song_id", "country", "date"],
                 "numeric_columns": ["streams", "duration"],
+                "categorical_columns": ["country", "device_type", "user_type"],
             },
             PlatformCode.AWA.value: {
                 "delimiter": "\t", 
@@ -115,6 +218,7 @@ class EnhancedETLParser:
                 "date_format": "%Y%m%d",  # Compact format
                 "expected_columns": ["track_id", "prefecture", "date"],
                 "numeric_columns": ["plays", "users"],
+                "categorical_columns": ["prefecture"],
             },
             PlatformCode.SPOTIFY.value: {
                 "delimiter": "\t",
@@ -122,6 +226,7 @@ class EnhancedETLParser:
                 "date_columns": ["date", "week"],
                 "expected_columns": ["track_name", "artist_name", "streams"],
                 "numeric_columns": ["streams", "stream_share"],
+                "categorical_columns": ["country", "age_bucket", "age_range", "gender"],
             },
             PlatformCode.VEVO.value: {
                 "delimiter": ",",  # Vevo uses CSV
@@ -150,6 +255,15 @@ class EnhancedETLParser:
         """
         FIXED: Robust encoding detection that prioritizes UTF-8 and avoids ASCII traps
         """
+        with open(file_path, 'rb') as f:
+            head = f.read(self.ENCODING_SAMPLE_SIZE + 1)
+        return self.detect_encoding_from_bytes(head, platform)
+    
+    def detect_encoding_from_bytes(self, raw_data: bytes, platform: Optional[str] = None) -> str:
+        """Detect the encoding of file contents already in memory from their leading bytes"""
+        sample = raw_data[:self.ENCODING_SAMPLE_SIZE]
+        complete = len(raw_data) <= self.ENCODING_SAMPLE_SIZE
+        
         # Get platform-specific encoding priority if available
         if platform:
             config = self.platform_configs.get(platform, {})
@@ -157,6 +271,15 @@ class EnhancedETLParser:
         else:
             priority_encodings = ['utf-8']
         
+        # Platforms pinned to a single encoding skip chardet as long as the file decodes with it
+        if platform and len(priority_encodings) == 1:
+            pinned_encoding = priority_encodings[0]
+            if pinned_encoding == 'utf-8' and sample.startswith(codecs.BOM_UTF8):
+                return 'utf-8-sig'
+            if self._test_encoding(sample, pinned_encoding, complete):
+                logger.debug(f"Using pinned {platform} encoding: {pinned_encoding}")
+                return pinned_encoding
+        
         # Always prioritize UTF-8 and common encodings over ASCII
         encodings_to_try = [
             'utf-8',           # Most common for modern files
@@ -169,22 +292,36 @@ class EnhancedETLParser:
         seen = set()
         encodings_to_try = [x for x in encodings_to_try if not (x in seen or seen.add(x))]
         
+        # Pure ASCII decodes identically as UTF-8, so chardet has nothing to add (escape
+        # bytes and '~{' are still left to it for ISO-2022/HZ detection)
+        if sample.isascii() and b'\x1b' not in sample and b'~{' not in sample:
+            logger.debug("Sample is pure ASCII, using UTF-8")
+            return 'utf-8'
+        
         # Try chardet first, but be skeptical of ASCII detection
         try:
-            with open(file_path, 'rb') as f:
-                raw_data = f.read(50000)  # Read more data for better detection
-                result = chardet.detect(raw_data)
+            # Feed the detector incrementally (up to 50KB) and stop as soon as it is certain
+            detector = chardet.UniversalDetector()
+            sample_size = 0
+            while sample_size < min(len(sample), 50000):
+                detector.feed(sample[sample_size:sample_size + 4096])
+                sample_size += 4096
+                if detector.done:
+                    break
+            detector.close()
+            fed_data = sample[:sample_size]
+            result = detector.result
                 
             if result and result.get('encoding'):
                 detected_encoding = result['encoding'].lower()
-                confidence = result.get('confidence', 0.0)
+                confidence = result.get('confidence') or 0.0
                 
                 logger.debug(f"Chardet detected: {detected_encoding} (confidence: {confidence:.2f})")
                 
                 # Be very skeptical of ASCII detection - often wrong for real-world files
                 if detected_encoding == 'ascii':
                     # Check if there are any high-bit bytes that would break ASCII
-                    if any(b > 127 for b in raw_data):
+                    if not fed_data.isascii():
                         logger.warning(f"Chardet detected ASCII but file contains non-ASCII bytes, using UTF-8")
                         return 'utf-8'
                     else:
@@ -202,7 +339,7 @@ class EnhancedETLParser:
                     detected_encoding = encoding_map.get(detected_encoding, detected_encoding)
                     
                     # Validate the detected encoding works
-                    if self._test_encoding(file_path, detected_encoding):
+                    if self._test_encoding(sample, detected_encoding, complete):
                         logger.info(f"Using chardet detected encoding: {detected_encoding}")
                         return detected_encoding
         
@@ -211,84 +348,92 @@ class EnhancedETLParser:
         
         # Manual testing of encodings in priority order
         for encoding in encodings_to_try:
-            if self._test_encoding(file_path, encoding):
+            if self._test_encoding(sample, encoding, complete):
                 logger.info(f"Using manually detected encoding: {encoding}")
                 return encoding
         
         # Last resort: UTF-8 with error handling
-        logger.warning(f"Could not reliably detect encoding for {file_path}, using UTF-8 with error handling")
+        logger.warning("Could not reliably detect encoding, using UTF-8 with error handling")
         return 'utf-8'
     
-    def _test_encoding(self, file_path: Path, encoding: str) -> bool:
-        """Test if an encoding can successfully decode the file"""
+    def _test_encoding(self, sample: bytes, encoding: str, complete: bool = True) -> bool:
+        """Test if an encoding can successfully decode a sample (a truncated sample may end mid-character)"""
         try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                # Try to read a substantial portion of the file
-                sample = f.read(100000)  # Read 100KB
-                # If we get here without exception, encoding works
-                return True
+            codecs.getincrementaldecoder(encoding)().decode(sample, final=complete)
+            return True
         except (UnicodeDecodeError, UnicodeError):
             return False
         except Exception:
             return False
     
-    def _read_file_safely(self, file_path: Path, encoding: str) -> str:
-        """
-        FIXED: Read file with encoding and graceful error handling
-        """
+    def _decode_safely(self, raw_data: bytes, encoding: str) -> str:
+        """Decode file contents like a text-mode read, replacing undecodable bytes as a fallback"""
         try:
-            with open(file_path, 'r', encoding=encoding) as f:
-                return f.read()
+            content = raw_data.decode(encoding)
         except UnicodeDecodeError as e:
             logger.warning(f"Unicode decode error with {encoding}: {e}")
             logger.info(f"Attempting to read with error replacement...")
             
-            try:
-                with open(file_path, 'r', encoding=encoding, errors='replace') as f:
-                    content = f.read()
-                    replaced_count = content.count('\ufffd')  # Unicode replacement character
-                    if replaced_count > 0:
-                        logger.warning(f"Replaced {replaced_count} invalid characters with placeholder")
-                    return content
-            except Exception as e2:
-                logger.error(f"Failed to read file even with error replacement: {e2}")
-                raise
-        except Exception as e:
-            logger.error(f"Error reading file: {e}")
-            raise
+            content = raw_data.decode(encoding, errors='replace')
+            replaced_count = content.count('\ufffd')  # Unicode replacement character
+            if replaced_count > 0:
+                logger.warning(f"Replaced {replaced_count} invalid characters with placeholder")
+        
+        # Universal newlines, as open() in text mode would give
+        if '\r' in content:
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
     
     def detect_platform(self, file_path: Path) -> Optional[str]:
         """Detect platform from file path and name"""
         path_str = str(file_path).lower()
         
-        # Platform detection from path
-        platform_patterns = {
-            PlatformCode.APPLE.value: ['apple', 'apl-apple', 'itunes'],
-            PlatformCode.FACEBOOK.value: ['facebook', 'fbk-facebook', 'meta'],
-            PlatformCode.SOUNDCLOUD.value: ['soundcloud', 'scu-soundcloud'],
-            PlatformCode.SPOTIFY.value: ['spotify', 'spo-spotify'],
-            PlatformCode.BOOMPLAY.value: ['boomplay', 'boo-boomplay'],
-            PlatformCode.AWA.value: ['awa', 'awa-awa'],
-            PlatformCode.VEVO.value: ['vevo', 'vvo-vevo'],
-            PlatformCode.PELOTON.value: ['peloton', 'plt-peloton'],
-            PlatformCode.DEEZER.value: ['deezer', 'dzr-deezer'],
-        }
+        if path_str not in self._platform_cache:
+            matches = self._platform_regex.findall(path_str)
+            self._platform_cache[path_str] = (
+                min(self._platform_priority[match] for match in matches)[1] if matches else None
+            )
+        
+        platform = self._platform_cache[path_str]
+        if platform is not None:
+            return platform
         
-        for platform, patterns in platform_patterns.items():
-            if any(pattern in path_str for pattern in patterns):
-                return platform
-                
         logger.warning(f"Could not detect platform from path: {file_path}")
         return None
     
-    def _detect_delimiter(self, file_content: str, platform: str) -> str:
-        """FIXED: Detect the actual delimiter used in the file content"""
+    def _text_for_reader(self, raw_data: bytes, encoding: str) -> Union[str, bytes]:
+        """
+        File contents ready for _read_delimited
+        
+        UTF-8 files stay bytes (with CRLF line endings normalized) so the Arrow reader
+        can take them without a decode and re-encode; anything else is decoded.
+        """
+        if codecs.lookup(encoding).name == 'utf-8' and not LONE_CARRIAGE_RETURN.search(raw_data):
+            return raw_data.replace(b'\r\n', b'\n') if b'\r' in raw_data else raw_data
+        return self._decode_safely(raw_data, encoding)
+    
+    @staticmethod
+    def _leading_lines(content: Union[str, bytes], count: int) -> Union[str, bytes]:
+        """The first count lines of content, sliced off so the rest of the file isn't copied"""
+        newline = b'\n' if isinstance(content, bytes) else '\n'
+        end = -1
+        for _ in range(count):
+            end = content.find(newline, end + 1)
+            if end == -1:
+                return content
+        return content[:end]
+    
+    def _detect_delimiter(self, file_content: Union[str, bytes], platform: str) -> str:
+        """FIXED: Detect the actual delimiter used in the file content (text or UTF-8 bytes)"""
         config = self.platform_configs.get(platform, {})
         expected_delimiter = config.get('delimiter', '\t')
         
         try:
             # Get first few lines to test
-            lines = file_content.split('\n')[:5]
+            head = self._leading_lines(file_content, 5)
+            if isinstance(head, bytes):
+                head = head.decode('utf-8', errors='replace')
+            lines = head.split('\n')
             sample_lines = [line.strip() for line in lines if line.strip()]
             
             if not sample_lines:
@@ -303,24 +448,22 @@ class EnhancedETLParser:
                 consistent_count = None
                 
                 for line in sample_lines:
-                    if delimiter in line:
-                        parts = line.split(delimiter)
-                        part_count = len(parts)
-                        
-                        if part_count > 1:  # Must split into multiple parts
-                            if consistent_count is None:
-                                consistent_count = part_count
-                                score += part_count * 2  # Bonus for splitting
-                            elif consistent_count == part_count:
-                                score += part_count * 3  # Bonus for consistency
-                            else:
-                                score += part_count  # Some penalty for inconsistency
+                    part_count = line.count(delimiter) + 1  # same as len(line.split(delimiter)), no list
+                    
+                    if part_count > 1:  # Must split into multiple parts
+                        if consistent_count is None:
+                            consistent_count = part_count
+                            score += part_count * 2  # Bonus for splitting
+                        elif consistent_count == part_count:
+                            score += part_count * 3  # Bonus for consistency
+                        else:
+                            score += part_count  # Some penalty for inconsistency
                 
                 delimiter_scores[delimiter] = score
             
             # Choose delimiter with highest score
             if delimiter_scores:
-                best_delimiter = max(delimiter_scores.keys(), key=lambda k: delimiter_scores[k])
+                best_delimiter = max(delimiter_scores, key=delimiter_scores.get)
                 
                 # Only use detected delimiter if it has a reasonable score
                 if delimiter_scores[best_delimiter] > 5:  # Minimum threshold
@@ -334,41 +477,114 @@ class EnhancedETLParser:
             logger.debug(f"Delimiter detection failed: {e}, using expected: '{expected_delimiter}'")
             return expected_delimiter
     
-    def _parse_apple_format(self, file_path: Path, encoding: str) -> ParseResult:
+    def _read_delimited(self, content: Union[str, bytes], delimiter: str, columns: Optional[List[str]] = None,
+                        quotechar: str = '"') -> pd.DataFrame:
+        """
+        Parse delimited text into an all-string DataFrame, using the Arrow CSV reader when available
+        
+        content may also be UTF-8 bytes, which Arrow reads as-is; they are only
+        decoded if the C parser fallback is needed. When columns is given only
+        those columns (if present) are converted.
+        """
+        if pa is not None:
+            try:
+                data = content if isinstance(content, bytes) else content.encode('utf-8')
+                return self._read_delimited_arrow(data, delimiter, columns, quotechar)
+            except Exception as e:
+                logger.debug(f"Arrow CSV reader failed ({e}), falling back to the C parser")
+        
+        if isinstance(content, bytes):
+            content = self._decode_safely(content, 'utf-8')
+        
+        return pd.read_csv(
+            io.StringIO(content),
+            delimiter=delimiter,
+            quotechar=quotechar,
+            on_bad_lines='skip',
+            dtype=str,  # Keep everything as string initially
+            usecols=(lambda name: name in columns) if columns else None
+        )
+    
+    def _read_delimited_arrow(self, data: bytes, delimiter: str, columns: Optional[List[str]] = None,
+                              quotechar: str = '"') -> pd.DataFrame:
+        """
+        Multi-threaded Arrow CSV read matching read_csv(dtype=str)
+        
+        Any row with the wrong number of fields raises, so the C parser handles
+        skipping or padding it. (An invalid_row_handler would be a Python callback
+        invoked from Arrow's reader threads, which can deadlock.)
+        """
+        parse_options = pa_csv.ParseOptions(delimiter=delimiter, quote_char=quotechar, newlines_in_values=True)
+        
+        # Read the header first so every column can be typed as string (keeps codes like 007 intact)
+        header_reader = pa_csv.open_csv(
+            io.BytesIO(data),
+            read_options=pa_csv.ReadOptions(block_size=1 << 16, use_threads=False),
+            parse_options=parse_options
+        )
+        column_names = header_reader.schema.names
+        header_reader.close()
+        if '' in column_names or len(set(column_names)) != len(column_names):
+            raise ValueError("blank or duplicate column names")
+        
+        include_columns = None
+        if columns:
+            include_columns = [name for name in column_names if name in columns]
+            if not include_columns:
+                raise ValueError("none of the requested columns are present")  # Arrow reads all for []
+        
+        table = pa_csv.read_csv(
+            io.BytesIO(data),
+            parse_options=parse_options,
+            convert_options=pa_csv.ConvertOptions(
+                column_types={name: pa.string() for name in column_names},
+                null_values=CSV_NA_VALUES,
+                strings_can_be_null=True,
+                include_columns=include_columns
+            )
+        )
+        df = table.to_pandas()
+        return df.where(df.notna(), np.nan)
+    
+    def _unwrap_apple_lines(self, raw_data: bytes, encoding: str) -> Union[str, bytes]:
+        """
+        Strip every line and unwrap quote-wrapped ones in C-level regex passes
+        
+        ASCII-compatible files are scanned as raw bytes and decoded once at the end;
+        UTF-8 results stay bytes so the CSV reader can take them without a decode
+        and re-encode. Other encodings, and old Mac line endings that need newline
+        translation, are decoded first.
+        """
+        codec_name = codecs.lookup(encoding).name
+        if codec_name in ASCII_COMPATIBLE_ENCODINGS and not LONE_CARRIAGE_RETURN.search(raw_data):
+            data = LINE_PADDING_BYTES.sub(b'', raw_data)
+            if UNWRAPPED_LINE_BYTES.search(data):
+                data = QUOTE_WRAPPED_LINE_BYTES.sub(lambda m: m.group(1).replace(b'""', b'"'), data)
+            else:
+                # Every line is wrapped (the usual Apple export): no per-line callback needed
+                data = QUOTE_WRAPPED_LINE_BYTES.sub(rb'\1', data).replace(b'""', b'"')
+            if codec_name == 'utf-8':
+                return data
+            try:
+                return data.decode(encoding)
+            except UnicodeDecodeError as e:
+                logger.warning(f"Unicode decode error with {encoding}: {e}")
+                return data.decode(encoding, errors='replace')
+        
+        content = self._decode_safely(raw_data, encoding)
+        content = LINE_PADDING.sub('', content)
+        return QUOTE_WRAPPED_LINE.sub(lambda m: m.group(1).replace('""', '"'), content)
+    
+    def _parse_apple_format(self, raw_data: bytes, encoding: str,
+                            columns: Optional[List[str]] = None) -> ParseResult:
         """Handle Apple's quote-wrapped tab-delimited format - FIXED"""
         try:
-            content = self._read_file_safely(file_path, encoding)
+            content = self._unwrap_apple_lines(raw_data, encoding)
             
-            # Split into lines
-            lines = content.strip().split('\n')
-            if not lines:
+            if not content.strip():
                 return ParseResult(success=False, error_message="Empty file")
             
-            processed_lines = []
-            
-            for line in lines:
-                line = line.strip()
-                
-                # Handle quote-wrapped lines
-                if line.startswith('"') and line.endswith('"'):
-                    # Remove outer quotes
-                    line = line[1:-1]
-                    
-                    # Handle escaped quotes within the content
-                    line = line.replace('""', '"')
-                
-                processed_lines.append(line)
-            
-            # Join back and parse as TSV
-            processed_content = '\n'.join(processed_lines)
-            
-            # Use StringIO to parse as TSV
-            df = pd.read_csv(
-                io.StringIO(processed_content),
-                delimiter='\t',
-                on_bad_lines='skip',
-                dtype=str  # Keep everything as string initially
-            )
+            df = self._read_delimited(content, '\t', columns)
             
             logger.debug(f"Apple parsing: {len(df)} rows, {len(df.columns)} columns")
             logger.debug(f"Columns: {list(df.columns)}")
@@ -388,19 +604,14 @@ class EnhancedETLParser:
                 error_message=f"Apple format parsing failed: {str(e)}"
             )
     
-    def _parse_facebook_format(self, file_path: Path, encoding: str) -> ParseResult:
+    def _parse_facebook_format(self, raw_data: bytes, encoding: str,
+                               columns: Optional[List[str]] = None) -> ParseResult:
         """Handle Facebook's quoted CSV format - FIXED"""
         try:
-            # Read file safely first
-            content = self._read_file_safely(file_path, encoding)
-            
-            # Use StringIO to parse
-            df = pd.read_csv(
-                io.StringIO(content),
-                quoting=csv.QUOTE_ALL,
-                on_bad_lines='skip',
-                dtype=str
-            )
+            content = self._text_for_reader(raw_data, encoding)
+            
+            config = self.platform_configs[PlatformCode.FACEBOOK.value]
+            df = self._read_delimited(content, config['delimiter'], columns, config['quotechar'])
             
             logger.debug(f"Facebook parsing: {len(df)} rows, {len(df.columns)} columns")
             
@@ -418,24 +629,18 @@ class EnhancedETLParser:
                 error_message=f"Facebook format parsing failed: {str(e)}"
             )
     
-    def _parse_standard_format(self, file_path: Path, platform: str, encoding: str) -> ParseResult:
+    def _parse_standard_format(self, raw_data: bytes, platform: str, encoding: str,
+                               columns: Optional[List[str]] = None) -> ParseResult:
         """Handle standard TSV/CSV formats - FIXED"""
         try:
-            # Read file content safely
-            content = self._read_file_safely(file_path, encoding)
+            content = self._text_for_reader(raw_data, encoding)
             
             # Detect actual delimiter from content
             delimiter = self._detect_delimiter(content, platform)
             
             logger.debug(f"Using delimiter: '{delimiter}'")
             
-            # Parse using StringIO for consistent handling
-            df = pd.read_csv(
-                io.StringIO(content),
-                delimiter=delimiter,
-                on_bad_lines='skip',
-                dtype=str
-            )
+            df = self._read_delimited(content, delimiter, columns)
             
             logger.debug(f"Standard parsing: {len(df)} rows, {len(df.columns)} columns")
             logger.debug(f"Columns: {list(df.columns)}")
@@ -461,8 +666,7 @@ class EnhancedETLParser:
         if df is None:
             return None
             
-        config = self.platform_configs.get(platform, {})
-        date_columns = config.get('date_columns', [])
+        date_column_matcher = self._date_column_matchers.get(platform)
         
         # Find actual date columns in the data
         actual_date_columns = []
@@ -476,65 +680,99 @@ class EnhancedETLParser:
                     actual_date_columns.append(col)
             else:
                 # For other platforms, use broader matching
-                if any(date_col.lower() in col_lower for date_col in date_columns):
+                if date_column_matcher is not None and date_column_matcher.search(col_lower):
                     actual_date_columns.append(col)
-                elif any(keyword in col_lower for keyword in ['date', 'time', 'timestamp']):
+                elif DATE_KEYWORD_COLUMN.search(col_lower):
                     # Exclude numeric columns that might have 'time' in name
-                    if not any(numeric_word in col_lower for numeric_word in ['watch_time', 'duration', 'seconds', 'minutes']):
+                    if not NON_DATE_TIME_COLUMN.search(col_lower):
                         actual_date_columns.append(col)
         
+        # Parse every date column first, then swap them in with a single assign
+        parsed_columns = {}
         for col in actual_date_columns:
             try:
-                df[col] = self._parse_date_column(df[col], platform)
+                parsed_columns[col] = self._parse_date_column(df[col], platform)
             except Exception as e:
                 logger.warning(f"Failed to parse date column {col}: {e}")
         
+        if parsed_columns:
+            df = df.assign(**parsed_columns)
+        
         return df
     
+    def _date_formats_for(self, platform: str) -> tuple:
+        """
+        Formats to try for a platform, in order, built once per platform
+        
+        The platform-specific format comes first, then all known formats, then pandas'
+        ISO 8601 parser for 'T'-separated timestamps; repeats are dropped because a
+        second attempt at the same format can't parse anything new.
+        """
+        formats = self._date_format_order.get(platform)
+        if formats is None:
+            platform_format = self.platform_configs.get(platform, {}).get('date_format')
+            candidates = ([platform_format] if platform_format else []) + list(self.date_formats) + ['ISO8601']
+            formats = self._date_format_order[platform] = tuple(dict.fromkeys(candidates))
+        return formats
+    
+    @staticmethod
+    def _to_datetime(values: pd.Index, fmt: str) -> pd.Index:
+        """
+        Parse a batch of date strings with one format, keeping each value's own UTC offset
+        
+        pandas refuses (newer versions) or warns about (older ones) a batch with mixed UTC
+        offsets, so such a batch is parsed value by value into tz-aware objects, as dateutil did.
+        """
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('ignore', FutureWarning)
+                return pd.to_datetime(values, format=fmt, errors='coerce')
+        except ValueError:
+            return pd.Index([pd.to_datetime(value, format=fmt, errors='coerce') for value in values], dtype=object)
+    
     def _parse_date_column(self, series: pd.Series, platform: str) -> pd.Series:
-        """Parse date column with multiple format attempts - FIXED"""
-        parsed_dates = []
+        """Parse date column with multiple format attempts - each distinct value is parsed once"""
+        # Convert to string and clean
+        values = series.dropna().astype(str).str.strip()
+        values = values[values != '']
+        unique_values = pd.Index(values.unique())
         
-        for value in series:
-            if pd.isna(value) or value == '':
-                parsed_dates.append(None)
-                continue
-                
-            # Convert to string and clean
-            value_str = str(value).strip()
-            
-            # Try platform-specific format first
-            config = self.platform_configs.get(platform, {})
-            platform_format = config.get('date_format')
-            
-            if platform_format:
-                try:
-                    parsed_date = datetime.strptime(value_str, platform_format)
-                    parsed_dates.append(parsed_date)
-                    continue
-                except:
-                    pass
-            
-            # Try all known formats
-            parsed = None
-            for fmt in self.date_formats:
-                try:
-                    parsed = datetime.strptime(value_str, fmt)
-                    break
-                except:
-                    continue
+        parsed_values: Dict[str, Any] = {}
+        remaining = unique_values
+        for fmt in self._date_formats_for(platform):
+            if remaining.empty:
+                break
             
-            # Last resort: use dateutil parser
-            if not parsed:
-                try:
-                    parsed = date_parser.parse(value_str)
-                except:
-                    logger.warning(f"Could not parse date: {value}")
-                    parsed = None
+            # Only values shaped like this format are worth a parse attempt
+            shape = self._date_format_patterns.get(fmt)
+            candidates = remaining[remaining.str.fullmatch(shape)] if shape else remaining
+            if candidates.empty:
+                continue
             
-            parsed_dates.append(parsed)
+            converted = self._to_datetime(candidates, fmt)
+            matched = converted.notna()
+            parsed_values.update(zip(candidates[matched], converted[matched]))
+            remaining = remaining[~remaining.isin(candidates[matched])]
+        
+        # Last resort: pandas' per-value format inference in one call, but only for values
+        # with a digit - without one there is no real date to find
+        candidates = remaining[remaining.str.contains(r'\d', regex=True)]
+        if not candidates.empty:
+            try:
+                # Values with different UTC offsets stay tz-aware objects, as with dateutil
+                converted = self._to_datetime(candidates, 'mixed')
+                matched = converted.notna()
+                parsed_values.update(zip(candidates[matched], converted[matched]))
+                remaining = remaining[~remaining.isin(candidates[matched])]
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Mixed-format date parsing failed: {e}")
+        for value in remaining:
+            logger.warning(f"Could not parse date: {value}")
         
-        return pd.Series(parsed_dates)
+        if not parsed_values:
+            return pd.Series(pd.NaT, index=series.index, dtype='datetime64[ns]')
+        
+        return values.map(parsed_values).reindex(series.index).infer_objects()
     
     def _calculate_quality_score(self, df: Optional[pd.DataFrame], platform: str) -> float:
         """Calculate data quality score (0-100)"""
@@ -548,7 +786,7 @@ class EnhancedETLParser:
         
         # Column completeness (30% weight)
         if expected_columns:
-            present_columns = sum(1 for col in expected_columns if col in df.columns)
+            present_columns = len(set(expected_columns).intersection(df.columns))
             column_score = (present_columns / len(expected_columns)) * 100
             scores.append(column_score * 0.3)
         else:
@@ -557,7 +795,8 @@ class EnhancedETLParser:
         
         # Data completeness (40% weight)  
         if len(df.columns) > 0:
-            non_null_ratio = (df.count().sum() / (len(df) * len(df.columns)))
+            null_mask = df.isna().to_numpy(dtype=np.bool_, copy=False)
+            non_null_ratio = 1 - np.count_nonzero(null_mask) / null_mask.size
             completeness_score = non_null_ratio * 100
         else:
             completeness_score = 0
@@ -572,62 +811,86 @@ class EnhancedETLParser:
         
         # Check numeric columns
         numeric_columns = config.get('numeric_columns', [])
-        for col in numeric_columns:
-            if col in df.columns:
-                try:
-                    pd.to_numeric(df[col], errors='coerce')
-                except:
-                    consistency_score -= 10
+        text_numeric = [col for col in df.columns.intersection(numeric_columns)
+                        if not pd.api.types.is_numeric_dtype(df[col])]
+        if text_numeric:
+            # Penalize by the share of present values that do not convert to numbers
+            values = df[text_numeric]
+            coerced = values.apply(pd.to_numeric, errors='coerce')
+            present = values.notna().to_numpy().sum()
+            if present:
+                unconvertible = (coerced.isna() & values.notna()).to_numpy().sum()
+                consistency_score -= int(unconvertible / present * 20)
         
         scores.append(min(consistency_score, 100) * 0.3)
         
         return sum(scores)
     
-    def parse_file(self, file_path: Path) -> ParseResult:
-        """Main parsing method that handles all platform formats - FIXED"""
+    def parse_file(self, file_path: Path, platform: Optional[str] = None,
+                   columns: Optional[List[str]] = None) -> ParseResult:
+        """
+        Main parsing method that handles all platform formats - FIXED
+        
+        Pass columns to convert only the columns a caller needs; the others are
+        skipped by the CSV reader rather than dropped afterwards.
+        """
         if not file_path.exists():
             return ParseResult(
                 success=False,
                 error_message=f"File not found: {file_path}"
             )
         
-        # Detect platform first
-        platform = self.detect_platform(file_path)
+        # Detect platform first (callers that already know it can pass it in)
+        if platform is None:
+            platform = self.detect_platform(file_path)
         if not platform:
             return ParseResult(
                 success=False,
                 error_message="Could not detect platform from file path"
             )
         
+        # Vendors that already deliver Parquet need none of the text-format machinery
+        if file_path.suffix.lower() in PARQUET_SUFFIXES:
+            return self._parse_parquet_file(file_path, platform, columns)
+        
+        cache_path = self._cache_path(file_path, platform, columns)
+        if cache_path is not None:
+            cached_result = self._load_cached_result(cache_path)
+            if cached_result is not None:
+                logger.info(f"Loaded cached parse of {file_path.name}")
+                return cached_result
+        
+        # Read the file once; encoding detection and parsing share the buffer
+        try:
+            raw_data = file_path.read_bytes()
+        except OSError as e:
+            return ParseResult(success=False, error_message=f"Could not read file: {e}")
+        
         # Detect encoding with platform context
-        encoding = self.detect_encoding(file_path, platform)
+        encoding = self.detect_encoding_from_bytes(raw_data, platform)
         
         logger.info(f"Parsing {file_path.name} as {platform} with encoding {encoding}")
         
         # Use platform-specific parsing logic
         try:
             if platform == PlatformCode.APPLE.value:
-                result = self._parse_apple_format(file_path, encoding)
+                result = self._parse_apple_format(raw_data, encoding, columns)
             elif platform == PlatformCode.FACEBOOK.value:
-                result = self._parse_facebook_format(file_path, encoding)
+                result = self._parse_facebook_format(raw_data, encoding, columns)
             else:
-                result = self._parse_standard_format(file_path, platform, encoding)
+                result = self._parse_standard_format(raw_data, platform, encoding, columns)
             
             if not result.success:
                 return result
             
-            # Standardize dates
-            try:
-                result.data = self._standardize_dates(result.data, platform)
-            except Exception as e:
-                logger.warning(f"Date standardization failed: {e}")
-            
-            # Calculate quality score
-            result.quality_score = self._calculate_quality_score(result.data, platform)
+            result = self._finalize_result(result, platform)
             
             logger.info(f"Parsing complete: {result.records_parsed} records, "
                        f"quality score: {result.quality_score:.1f}")
             
+            if cache_path is not None:
+                self._store_cached_result(cache_path, result)
+            
             return result
             
         except Exception as e:
@@ -636,6 +899,173 @@ class EnhancedETLParser:
                 success=False,
                 error_message=f"Parsing failed: {str(e)}"
             )
+    
+    def _parse_parquet_file(self, file_path: Path, platform: str,
+                            columns: Optional[List[str]] = None) -> ParseResult:
+        """Read a Parquet source file directly - it is already typed and columnar"""
+        if pa is None:
+            return ParseResult(success=False, error_message="Reading Parquet files requires pyarrow")
+        
+        try:
+            if columns:
+                columns = [name for name in pq.read_schema(file_path).names if name in columns]
+            df = pq.read_table(file_path, columns=columns or None).to_pandas()
+        except Exception as e:
+            logger.error(f"Parquet parsing failed: {e}")
+            return ParseResult(success=False, error_message=f"Parquet parsing failed: {str(e)}")
+        
+        logger.info(f"Read {file_path.name} as Parquet: {len(df)} records")
+        
+        return ParseResult(
+            success=True,
+            data=df,
+            quality_score=self._calculate_quality_score(df, platform),
+            records_parsed=len(df),
+            encoding_detected='binary',
+            format_detected='parquet'
+        )
+    
+    def _cache_path(self, file_path: Path, platform: str, columns: Optional[List[str]]) -> Optional[Path]:
+        """Cache file for this exact file version and parse request, or None when caching is off"""
+        if self.cache_dir is None:
+            return None
+        
+        stat = file_path.stat()
+        key = f"{file_path.resolve()}|{stat.st_mtime_ns}|{stat.st_size}|{platform}|{columns}"
+        return self.cache_dir / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.parquet"
+    
+    def _load_cached_result(self, cache_path: Path) -> Optional[ParseResult]:
+        """Rebuild a ParseResult from a cached Parquet file"""
+        if not cache_path.exists():
+            return None
+        
+        try:
+            table = pq.read_table(cache_path)
+            fields = json.loads(table.schema.metadata[b'etl_parse_result'])
+            df = table.to_pandas()
+            df = df.where(df.notna(), np.nan)  # Parquet nulls come back as None
+            return ParseResult(success=True, data=df, **fields)
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable parse cache {cache_path}: {e}")
+            return None
+    
+    def _store_cached_result(self, cache_path: Path, result: ParseResult) -> None:
+        """Write a successful ParseResult to the Parquet cache (best effort)"""
+        try:
+            fields = {
+                'records_parsed': result.records_parsed,
+                'records_failed': result.records_failed,
+                'encoding_detected': result.encoding_detected,
+                'format_detected': result.format_detected,
+                'quality_score': result.quality_score,
+            }
+            table = pa.Table.from_pandas(result.data)
+            metadata = {**(table.schema.metadata or {}), b'etl_parse_result': json.dumps(fields).encode('utf-8')}
+            
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            pq.write_table(table.replace_schema_metadata(metadata), cache_path, compression='zstd')
+        except Exception as e:
+            logger.debug(f"Could not cache parse result in {cache_path}: {e}")
+    
+    def parse_file_chunks(self, file_path: Path, platform: Optional[str] = None,
+                          chunksize: int = CHUNK_SIZE) -> Iterator[ParseResult]:
+        """
+        Parse a large file in chunks of rows, yielding one ParseResult per chunk
+        
+        Dates, categoricals and the quality score are handled per chunk, so peak memory
+        follows the chunk size rather than the file size. Apple files have to be
+        unwrapped as a whole, and Parquet files are read directly; both are yielded as
+        a single chunk.
+        """
+        if not file_path.exists():
+            yield ParseResult(success=False, error_message=f"File not found: {file_path}")
+            return
+        
+        if platform is None:
+            platform = self.detect_platform(file_path)
+        if not platform:
+            yield ParseResult(success=False, error_message="Could not detect platform from file path")
+            return
+        
+        if platform == PlatformCode.APPLE.value or file_path.suffix.lower() in PARQUET_SUFFIXES:
+            yield self.parse_file(file_path, platform)
+            return
+        
+        encoding = self.detect_encoding(file_path, platform)
+        logger.info(f"Parsing {file_path.name} as {platform} with encoding {encoding} in chunks of {chunksize} rows")
+        
+        try:
+            with open(file_path, 'r', encoding=encoding, errors='replace') as f:
+                quotechar = self.platform_configs.get(platform, {}).get('quotechar', '"')
+                if platform == PlatformCode.FACEBOOK.value:
+                    delimiter = ','
+                    format_name = "facebook_quoted_csv"
+                else:
+                    delimiter = self._detect_delimiter(f.read(self.ENCODING_SAMPLE_SIZE), platform)
+                    f.seek(0)
+                    format_name = f"standard_{'csv' if delimiter == ',' else 'tsv'}"
+                
+                reader = pd.read_csv(
+                    f,
+                    delimiter=delimiter,
+                    quotechar=quotechar,
+                    on_bad_lines='skip',
+                    dtype=str,
+                    chunksize=chunksize
+                )
+                for chunk in reader:
+                    yield self._finalize_result(ParseResult(
+                        success=True,
+                        data=chunk,
+                        records_parsed=len(chunk),
+                        encoding_detected=encoding,
+                        format_detected=format_name
+                    ), platform)
+        
+        except Exception as e:
+            logger.error(f"Chunked parsing failed: {e}")
+            yield ParseResult(
+                success=False,
+                error_message=f"Parsing failed: {str(e)}"
+            )
+    
+    def _finalize_result(self, result: ParseResult, platform: str) -> ParseResult:
+        """Standardize dates, apply categorical dtypes and score a successfully parsed frame"""
+        # Standardize dates
+        try:
+            result.data = self._standardize_dates(result.data, platform)
+        except Exception as e:
+            logger.warning(f"Date standardization failed: {e}")
+        
+        # Store low-cardinality text columns as categoricals to cut memory downstream
+        categorical_columns = self.platform_configs.get(platform, {}).get('categorical_columns', [])
+        for column in result.data.columns.intersection(categorical_columns):
+            result.data[column] = result.data[column].astype('category')
+        
+        # Calculate quality score
+        result.quality_score = self._calculate_quality_score(result.data, platform)
+        
+        return result
+    
+    def parse_files(self, file_paths: List[Path], max_workers: Optional[int] = None) -> List[ParseResult]:
+        """Parse independent files in parallel worker processes, preserving input order"""
+        file_paths = [Path(file_path) for file_path in file_paths]
+        max_workers = max_workers or os.cpu_count() or 1
+        
+        if max_workers <= 1 or len(file_paths) <= 1:
+            return [self.parse_file(file_path) for file_path in file_paths]
+        
+        results = []
+        with ProcessPoolExecutor(max_workers=min(max_workers, len(file_paths))) as executor:
+            futures = [executor.submit(self.parse_file, file_path) for file_path in file_paths]
+            for file_path, future in zip(file_paths, futures):
+                try:
+                    results.append(future.result())
+                except Exception as e:
+                    logger.error(f"Worker failed parsing {file_path}: {e}")
+                    results.append(ParseResult(success=False, error_message=f"Parsing failed: {str(e)}"))
+        
+        return results
 
 
 # Example usage and testing
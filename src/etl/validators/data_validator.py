@@ -6,8 +6,10 @@ Fixed version with proper imports and syntax
 """
 from __future__ import annotations
 
+import os
 import re
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from dataclasses import dataclass, field
 from enum import Enum
@@ -15,6 +17,8 @@ from typing import Any
 import pandas as pd
 import numpy as np
 
+from ..parsers.enhanced_parser import NON_DATE_TIME_COLUMN
+
 logger = logging.getLogger(__name__)
 
 
@@ -57,9 +61,57 @@ class StreamingDataValidator:
     Implements validation rules based on real-world data analysis
     """
     
+    # Frames at least this long run their validation checks on a thread pool
+    PARALLEL_VALIDATION_MIN_ROWS = 100000
+    
+    # Longer date columns are checked on a fixed-seed random sample of this many values
+    DATE_VALIDATION_SAMPLE_SIZE = 200000
+    
+    # Quality score points deducted per issue of each severity
+    SEVERITY_DEDUCTIONS = {
+        ValidationSeverity.CRITICAL: 30,
+        ValidationSeverity.ERROR: 15,
+        ValidationSeverity.WARNING: 5,
+        ValidationSeverity.INFO: 1,
+    }
+    
     def __init__(self):
         self.validation_rules = self._load_validation_rules()
         self.platform_specific_rules = self._load_platform_specific_rules()
+        self._isrc_pattern = re.compile(self.validation_rules["isrc_format"]["pattern"])
+        
+        # Column-name-matched rules as (match key, rule) pairs, with the rule found for each column memoized
+        self._numeric_rule_items = [
+            (rule_name, rule) for rule_name, rule in self.validation_rules["numeric_ranges"].items()
+            if isinstance(rule, dict)
+        ]
+        self._text_rule_items = [
+            (rule_name.replace("_", "").replace(" ", ""), rule)
+            for rule_name, rule in self.validation_rules["text_length"].items()
+            if isinstance(rule, dict)
+        ]
+        self._numeric_rule_cache: dict[str, dict | None] = {}
+        self._text_rule_cache: dict[str, dict | None] = {}
+        self._score_category_cache: dict[str, str] = {}
+        
+        # Each platform's device patterns combined into one case-insensitive regex
+        self._device_patterns = {
+            platform: re.compile("|".join(f"(?:{pattern})" for pattern in rules["device_patterns"]), re.IGNORECASE)
+            for platform, rules in self.platform_specific_rules.items()
+            if rules.get("device_patterns")
+        }
+        
+        # Expected country codes per geographic platform
+        self._country_codes = {
+            platform: frozenset(rules["country_codes"])
+            for platform, rules in self.platform_specific_rules.items()
+            if "country_codes" in rules
+        }
+        
+        # Approximate rule counts: 8 general rules plus each platform's own
+        self._total_rules_by_platform = {
+            platform: 8 + len(rules) for platform, rules in self.platform_specific_rules.items()
+        }
     
     def _load_validation_rules(self) -> dict[str, dict]:
         """Load general validation rules applicable to all platforms"""
@@ -177,23 +229,37 @@ class StreamingDataValidator:
                 metrics=metrics
             )
         
-        # Run all validation checks
-        issues.extend(self._validate_required_columns(df, platform))
-        issues.extend(self._validate_data_completeness(df))
-        issues.extend(self._validate_data_types(df, platform))
-        issues.extend(self._validate_date_formats(df, platform))
-        issues.extend(self._validate_numeric_ranges(df))
-        issues.extend(self._validate_text_fields(df))
-        issues.extend(self._validate_isrc_codes(df))
-        issues.extend(self._validate_platform_specific(df, platform))
-        issues.extend(self._validate_data_consistency(df, platform))
+        # Run all validation checks, sharing each column's non-null values between them
+        non_null: dict[str, pd.Series] = {}
+        checks = [
+            (self._validate_required_columns, (df, platform)),
+            (self._validate_data_completeness, (df,)),
+            (self._validate_data_types, (df, platform, non_null)),
+            (self._validate_date_formats, (df, platform, non_null)),
+            (self._validate_numeric_ranges, (df,)),
+            (self._validate_text_fields, (df, non_null)),
+            (self._validate_isrc_codes, (df, non_null)),
+            (self._validate_platform_specific, (df, platform, non_null)),
+            (self._validate_data_consistency, (df, platform, non_null)),
+        ]
+        
+        # The checks only read df, so large frames run them concurrently (pandas and
+        # NumPy release the GIL in their scans); issues keep the sequential order
+        max_workers = min(len(checks), os.cpu_count() or 1)
+        if max_workers > 1 and len(df) >= self.PARALLEL_VALIDATION_MIN_ROWS:
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(check, *args) for check, args in checks]
+                for future in futures:
+                    issues.extend(future.result())
+        else:
+            for check, args in checks:
+                issues.extend(check(*args))
         
         # Calculate quality scores
         scores = self._calculate_quality_scores(issues, df)
         
         # Count passed vs total rules
         total_rules = self._count_total_rules(platform)
-        critical_errors = sum(1 for issue in issues if issue.severity == ValidationSeverity.CRITICAL)
         passed_rules = total_rules - len(issues)
         
         return ValidationResult(
@@ -230,24 +296,26 @@ class StreamingDataValidator:
         """Validate data completeness (non-null values)"""
         issues = []
         
-        for column in df.columns:
-            null_count = df[column].isnull().sum()
-            null_percentage = (null_count / len(df)) * 100
-            
-            if null_percentage > 80:  # More than 80% null values
+        # Null counts for every column in one pass; only columns over 80% null need an issue
+        null_counts = df.isna().sum()
+        null_percentages = (null_counts / len(df)) * 100
+        flagged = (null_percentages > 80).to_numpy()
+        
+        for column, null_count, null_percentage in zip(df.columns[flagged], null_counts[flagged], null_percentages[flagged]):
+            if null_percentage > 95:  # More than 95% null values
                 issues.append(ValidationIssue(
-                    rule_name="high_null_percentage",
-                    severity=ValidationSeverity.WARNING,
-                    message=f"Column '{column}' has {null_percentage:.1f}% null values",
+                    rule_name="extremely_high_null_percentage",
+                    severity=ValidationSeverity.ERROR,
+                    message=f"Column '{column}' has {null_percentage:.1f}% null values - mostly empty",
                     column=column,
                     row_count=null_count,
                     percentage=null_percentage
                 ))
-            elif null_percentage > 95:  # More than 95% null values
+            else:  # More than 80% null values
                 issues.append(ValidationIssue(
-                    rule_name="extremely_high_null_percentage",
-                    severity=ValidationSeverity.ERROR,
-                    message=f"Column '{column}' has {null_percentage:.1f}% null values - mostly empty",
+                    rule_name="high_null_percentage",
+                    severity=ValidationSeverity.WARNING,
+                    message=f"Column '{column}' has {null_percentage:.1f}% null values",
                     column=column,
                     row_count=null_count,
                     percentage=null_percentage
@@ -255,7 +323,7 @@ class StreamingDataValidator:
         
         return issues
     
-    def _validate_data_types(self, df: pd.DataFrame, platform: str) -> list[ValidationIssue]:
+    def _validate_data_types(self, df: pd.DataFrame, platform: str, non_null: dict[str, pd.Series]) -> list[ValidationIssue]:
         """Validate data types and detect inconsistencies"""
         issues = []
         
@@ -263,14 +331,15 @@ class StreamingDataValidator:
         for column in df.columns:
             if df[column].dtype == 'object':  # Text columns
                 # Check if column should be numeric
-                non_null_values = df[column].dropna()
+                non_null_values = self._non_null_values(df, column, non_null)
                 if len(non_null_values) > 0:
-                    # Try to convert to numeric
-                    numeric_convertible = pd.to_numeric(non_null_values, errors='coerce').notna().sum()
+                    # Try to convert to numeric (once - the mask also gives the samples)
+                    non_numeric_mask = pd.to_numeric(non_null_values, errors='coerce').isna()
+                    numeric_convertible = len(non_null_values) - non_numeric_mask.sum()
                     numeric_percentage = (numeric_convertible / len(non_null_values)) * 100
                     
                     if 50 <= numeric_percentage < 95:  # Mixed numeric/text
-                        sample_non_numeric = non_null_values[pd.to_numeric(non_null_values, errors='coerce').isna()].head(3).tolist()
+                        sample_non_numeric = non_null_values[non_numeric_mask].head(3).tolist()
                         issues.append(ValidationIssue(
                             rule_name="mixed_data_types",
                             severity=ValidationSeverity.WARNING,
@@ -281,21 +350,22 @@ class StreamingDataValidator:
         
         return issues
     
-    def _validate_date_formats(self, df: pd.DataFrame, platform: str) -> list[ValidationIssue]:
+    def _validate_date_formats(self, df: pd.DataFrame, platform: str, non_null: dict[str, pd.Series]) -> list[ValidationIssue]:
         """Validate date formats based on platform-specific patterns"""
         issues = []
         date_columns = self._identify_date_columns(df)
         
         for column in date_columns:
-            unparseable_dates = []
-            non_null_values = df[column].dropna()
+            non_null_values = self._non_null_values(df, column, non_null)
+            checked_values = non_null_values
+            if len(non_null_values) > self.DATE_VALIDATION_SAMPLE_SIZE:
+                checked_values = non_null_values.sample(n=self.DATE_VALIDATION_SAMPLE_SIZE, random_state=0).sort_index()
+            unparseable_dates = checked_values[self._unparseable_date_mask(checked_values, platform)]
             
-            for value in non_null_values.head(100):  # Sample first 100 dates
-                if not self._is_valid_date(str(value), platform):
-                    unparseable_dates.append(value)
-            
-            if unparseable_dates:
-                unparseable_percentage = (len(unparseable_dates) / len(non_null_values)) * 100
+            if len(unparseable_dates) > 0:
+                unparseable_percentage = (len(unparseable_dates) / len(checked_values)) * 100
+                # Scaled up to the whole column when only a sample was parsed
+                unparseable_count = round(len(unparseable_dates) * len(non_null_values) / len(checked_values))
                 
                 severity = ValidationSeverity.CRITICAL if unparseable_percentage > 10 else ValidationSeverity.WARNING
                 
@@ -304,8 +374,8 @@ class StreamingDataValidator:
                     severity=severity,
                     message=f"Column '{column}' has unparseable date values",
                     column=column,
-                    row_count=len(unparseable_dates),
-                    sample_values=unparseable_dates[:3],
+                    row_count=unparseable_count,
+                    sample_values=unparseable_dates.head(3).tolist(),
                     percentage=unparseable_percentage
                 ))
         
@@ -314,69 +384,60 @@ class StreamingDataValidator:
     def _validate_numeric_ranges(self, df: pd.DataFrame) -> list[ValidationIssue]:
         """Validate numeric values are within expected ranges"""
         issues = []
-        numeric_rules = self.validation_rules["numeric_ranges"]
         
         for column in df.columns:
-            column_lower = column.lower()
-            
-            # Find applicable numeric rules
-            applicable_rule = None
-            for rule_name in numeric_rules:
-                if rule_name in column_lower and isinstance(numeric_rules[rule_name], dict):
-                    applicable_rule = numeric_rules[rule_name]
-                    break
+            applicable_rule = self._numeric_rule_for(column)
             
             if applicable_rule and pd.api.types.is_numeric_dtype(df[column]):
                 min_val = applicable_rule.get("min")
                 max_val = applicable_rule.get("max")
+                values = df[column]
                 
+                # Count with boolean masks; only slice out values when there are samples to show
                 if min_val is not None:
-                    below_min = df[df[column] < min_val]
-                    if len(below_min) > 0:
+                    below_min = values < min_val
+                    below_count = int(below_min.sum())
+                    if below_count > 0:
                         issues.append(ValidationIssue(
                             rule_name="value_below_minimum",
                             severity=ValidationSeverity.ERROR,
-                            message=f"Column '{column}' has {len(below_min)} values below minimum {min_val}",
+                            message=f"Column '{column}' has {below_count} values below minimum {min_val}",
                             column=column,
-                            row_count=len(below_min),
-                            sample_values=below_min[column].head(3).tolist()
+                            row_count=below_count,
+                            sample_values=values[below_min].head(3).tolist()
                         ))
                 
                 if max_val is not None:
-                    above_max = df[df[column] > max_val]
-                    if len(above_max) > 0:
+                    above_max = values > max_val
+                    above_count = int(above_max.sum())
+                    if above_count > 0:
                         issues.append(ValidationIssue(
                             rule_name="value_above_maximum",
                             severity=ValidationSeverity.ERROR,
-                            message=f"Column '{column}' has {len(above_max)} values above maximum {max_val}",
+                            message=f"Column '{column}' has {above_count} values above maximum {max_val}",
                             column=column,
-                            row_count=len(above_max),
-                            sample_values=above_max[column].head(3).tolist()
+                            row_count=above_count,
+                            sample_values=values[above_max].head(3).tolist()
                         ))
         
         return issues
     
-    def _validate_text_fields(self, df: pd.DataFrame) -> list[ValidationIssue]:
+    def _validate_text_fields(self, df: pd.DataFrame, non_null: dict[str, pd.Series]) -> list[ValidationIssue]:
         """Validate text field lengths and content"""
         issues = []
-        text_rules = self.validation_rules["text_length"]
         
         for column in df.columns:
-            column_lower = column.lower()
-            
-            # Find applicable text rules
-            applicable_rule = None
-            for rule_name in text_rules:
-                if rule_name.replace("_", "").replace(" ", "") in column_lower.replace("_", "").replace(" ", ""):
-                    applicable_rule = text_rules[rule_name]
-                    break
+            applicable_rule = self._text_rule_for(column)
             
             if applicable_rule and df[column].dtype == 'object':
                 min_len = applicable_rule.get("min", 0)
                 max_len = applicable_rule.get("max", float('inf'))
                 
-                # Check string lengths
-                string_lengths = df[column].dropna().astype(str).str.len()
+                # Check string lengths (only copying through astype(str) if there are non-strings)
+                text_values = self._non_null_values(df, column, non_null)
+                if pd.api.types.infer_dtype(text_values, skipna=False) != "string":
+                    text_values = text_values.astype(str)
+                string_lengths = text_values.str.len()
                 
                 if min_len > 0:
                     too_short = string_lengths[string_lengths < min_len]
@@ -402,24 +463,39 @@ class StreamingDataValidator:
         
         return issues
     
-    def _validate_isrc_codes(self, df: pd.DataFrame) -> list[ValidationIssue]:
+    def _numeric_rule_for(self, column: str) -> dict | None:
+        """Find the numeric range rule whose name appears in a column name"""
+        if column not in self._numeric_rule_cache:
+            column_lower = column.lower()
+            self._numeric_rule_cache[column] = next(
+                (rule for rule_name, rule in self._numeric_rule_items if rule_name in column_lower), None
+            )
+        return self._numeric_rule_cache[column]
+    
+    def _text_rule_for(self, column: str) -> dict | None:
+        """Find the text length rule whose name appears in a column name (ignoring '_' and spaces)"""
+        if column not in self._text_rule_cache:
+            column_key = column.lower().replace("_", "").replace(" ", "")
+            self._text_rule_cache[column] = next(
+                (rule for rule_key, rule in self._text_rule_items if rule_key in column_key), None
+            )
+        return self._text_rule_cache[column]
+    
+    def _validate_isrc_codes(self, df: pd.DataFrame, non_null: dict[str, pd.Series]) -> list[ValidationIssue]:
         """Validate ISRC codes format"""
         issues = []
         isrc_columns = [col for col in df.columns if 'isrc' in col.lower()]
         
         for column in isrc_columns:
-            non_null_isrcs = df[column].dropna()
+            non_null_isrcs = self._non_null_values(df, column, non_null)
             if len(non_null_isrcs) == 0:
                 continue
-                
-            pattern = self.validation_rules["isrc_format"]["pattern"]
-            invalid_isrcs = []
             
-            for isrc in non_null_isrcs:
-                if not re.match(pattern, str(isrc)):
-                    invalid_isrcs.append(isrc)
+            # One vectorized match over the column instead of a re.match per value
+            valid_mask = non_null_isrcs.astype(str).str.match(self._isrc_pattern)
+            invalid_isrcs = non_null_isrcs[~valid_mask]
             
-            if invalid_isrcs:
+            if len(invalid_isrcs) > 0:
                 invalid_percentage = (len(invalid_isrcs) / len(non_null_isrcs)) * 100
                 
                 issues.append(ValidationIssue(
@@ -428,13 +504,13 @@ class StreamingDataValidator:
                     message=f"Column '{column}' has {len(invalid_isrcs)} invalid ISRC codes ({invalid_percentage:.1f}%)",
                     column=column,
                     row_count=len(invalid_isrcs),
-                    sample_values=invalid_isrcs[:3],
+                    sample_values=invalid_isrcs.head(3).tolist(),
                     percentage=invalid_percentage
                 ))
         
         return issues
     
-    def _validate_platform_specific(self, df: pd.DataFrame, platform: str) -> list[ValidationIssue]:
+    def _validate_platform_specific(self, df: pd.DataFrame, platform: str, non_null: dict[str, pd.Series]) -> list[ValidationIssue]:
         """Apply platform-specific validation rules"""
         issues = []
         platform_rules = self.platform_specific_rules.get(platform, {})
@@ -448,48 +524,44 @@ class StreamingDataValidator:
                 pass
         
         # Validate country codes for geographic platforms
-        if "country_codes" in platform_rules:
+        expected_countries = self._country_codes.get(platform)
+        if expected_countries is not None:
             country_columns = [col for col in df.columns if 'country' in col.lower()]
-            expected_countries = set(platform_rules["country_codes"])
             
             for column in country_columns:
-                unique_countries = set(df[column].dropna().unique())
-                invalid_countries = unique_countries - expected_countries
+                countries = self._non_null_values(df, column, non_null)
+                invalid_countries = countries[~countries.isin(expected_countries)].unique().tolist()
                 
                 if invalid_countries:
                     issues.append(ValidationIssue(
                         rule_name="invalid_country_codes",
                         severity=ValidationSeverity.WARNING,
-                        message=f"Column '{column}' has unexpected country codes: {list(invalid_countries)}",
+                        message=f"Column '{column}' has unexpected country codes: {invalid_countries}",
                         column=column,
-                        sample_values=list(invalid_countries)[:5]
+                        sample_values=invalid_countries[:5]
                     ))
         
-        # Validate device patterns for Boomplay
-        if platform == "boo-boomplay" and "device_patterns" in platform_rules:
+        # Validate device patterns (Boomplay)
+        device_pattern = self._device_patterns.get(platform)
+        if device_pattern is not None:
             device_columns = [col for col in df.columns if 'device' in col.lower()]
-            patterns = platform_rules["device_patterns"]
             
             for column in device_columns:
-                devices = df[column].dropna()
-                unmatched_devices = []
-                
-                for device in devices.unique():
-                    if not any(re.search(pattern, str(device), re.IGNORECASE) for pattern in patterns):
-                        unmatched_devices.append(device)
+                devices = pd.Series(self._non_null_values(df, column, non_null).unique())
+                unmatched_devices = devices[~devices.astype(str).str.contains(device_pattern)]
                 
-                if unmatched_devices:
+                if len(unmatched_devices) > 0:
                     issues.append(ValidationIssue(
                         rule_name="unexpected_device_format",
                         severity=ValidationSeverity.INFO,
                         message=f"Column '{column}' has unexpected device formats",
                         column=column,
-                        sample_values=unmatched_devices[:3]
+                        sample_values=unmatched_devices.head(3).tolist()
                     ))
         
         return issues
     
-    def _validate_data_consistency(self, df: pd.DataFrame, platform: str) -> list[ValidationIssue]:
+    def _validate_data_consistency(self, df: pd.DataFrame, platform: str, non_null: dict[str, pd.Series]) -> list[ValidationIssue]:
         """Validate data consistency within the dataset"""
         issues = []
         
@@ -512,83 +584,72 @@ class StreamingDataValidator:
         
         for column in name_columns:
             if df[column].dtype == 'object':
-                # Check for case inconsistencies
-                unique_values = df[column].dropna().unique()
-                case_issues = []
-                
-                seen_lower = {}
-                for value in unique_values:
-                    lower_value = str(value).lower()
-                    if lower_value in seen_lower and seen_lower[lower_value] != value:
-                        case_issues.append((seen_lower[lower_value], value))
-                    else:
-                        seen_lower[lower_value] = value
+                # Check for case inconsistencies: distinct values whose lowercase form was already seen
+                unique_values = pd.Series(self._non_null_values(df, column, non_null).unique())
+                lower_values = unique_values.astype(str).str.lower()
+                repeated = lower_values.duplicated()
                 
-                if case_issues:
+                if repeated.any():
+                    first_spellings = pd.Series(unique_values[~repeated].to_numpy(), index=lower_values[~repeated])
+                    case_pairs = zip(lower_values[repeated].head(3).map(first_spellings), unique_values[repeated].head(3))
                     issues.append(ValidationIssue(
                         rule_name="case_inconsistency",
                         severity=ValidationSeverity.WARNING,
                         message=f"Column '{column}' has case inconsistencies",
                         column=column,
-                        row_count=len(case_issues),
-                        sample_values=[f"{pair[0]} vs {pair[1]}" for pair in case_issues[:3]]
+                        row_count=int(repeated.sum()),
+                        sample_values=[f"{first} vs {value}" for first, value in case_pairs]
                     ))
         
         return issues
     
+    @staticmethod
+    def _non_null_values(df: pd.DataFrame, column: str, non_null: dict[str, pd.Series]) -> pd.Series:
+        """A column's non-null values, computed once per validation run and shared between checks"""
+        values = non_null.get(column)
+        if values is None:
+            # Concurrent checks may both compute it; either result is the same
+            values = non_null[column] = df[column].dropna()
+        return values
+    
     def _identify_date_columns(self, df: pd.DataFrame) -> list[str]:
-        """Identify columns that likely contain dates"""
+        """Identify columns that likely contain dates (skipping durations like watch_time, as the parser does)"""
         date_indicators = ['date', 'time', 'timestamp', 'created', 'updated', 'period']
-        return [col for col in df.columns if any(indicator in col.lower() for indicator in date_indicators)]
+        return [
+            col for col in df.columns
+            if any(indicator in col.lower() for indicator in date_indicators)
+            and not NON_DATE_TIME_COLUMN.search(col.lower())
+        ]
     
-    def _is_valid_date(self, value: str, platform: str) -> bool:
-        """Check if a value is a valid date"""
-        # Platform-specific date format checking
+    def _unparseable_date_mask(self, values: pd.Series, platform: str) -> np.ndarray:
+        """Flag values that are not valid dates, parsing the whole column at once"""
+        text_values = values.astype(str)
+        unparseable = np.ones(len(text_values), dtype=bool)
+        
+        # Platform-specific date format first
         platform_rules = self.platform_specific_rules.get(platform, {})
         specific_format = platform_rules.get("date_format")
-        
         if specific_format:
-            try:
-                datetime.strptime(value, specific_format)
-                return True
-            except:
-                pass
+            parsed = pd.to_datetime(text_values, format=specific_format, errors='coerce', utc=True)
+            unparseable &= parsed.isna().to_numpy()
+        
+        # Then general date parsing (utc=True so mixed timezones parse together)
+        if unparseable.any():
+            parsed = pd.to_datetime(text_values[unparseable], format='mixed', errors='coerce', utc=True)
+            unparseable[unparseable] = parsed.isna().to_numpy()
         
-        # Try general date parsing
-        try:
-            from dateutil import parser as date_parser
-            date_parser.parse(value)
-            return True
-        except:
-            return False
+        return unparseable
     
     def _calculate_quality_scores(self, issues: list[ValidationIssue], df: pd.DataFrame) -> dict[str, float]:
         """Calculate quality scores based on validation issues"""
-        # Base scores
-        completeness_score = 100.0
-        consistency_score = 100.0
-        validity_score = 100.0
-        
-        # Deduct points based on issues
+        # Total deductions per score category
+        deductions = {"completeness": 0, "consistency": 0, "validity": 0}
         for issue in issues:
-            deduction = 0
-            
-            if issue.severity == ValidationSeverity.CRITICAL:
-                deduction = 30
-            elif issue.severity == ValidationSeverity.ERROR:
-                deduction = 15
-            elif issue.severity == ValidationSeverity.WARNING:
-                deduction = 5
-            elif issue.severity == ValidationSeverity.INFO:
-                deduction = 1
-            
-            # Apply deduction to appropriate score category
-            if "completeness" in issue.rule_name or "null" in issue.rule_name:
-                completeness_score -= deduction
-            elif "consistency" in issue.rule_name or "duplicate" in issue.rule_name:
-                consistency_score -= deduction
-            else:
-                validity_score -= deduction
+            deductions[self._score_category(issue.rule_name)] += self.SEVERITY_DEDUCTIONS.get(issue.severity, 0)
+        
+        completeness_score = 100.0 - deductions["completeness"]
+        consistency_score = 100.0 - deductions["consistency"]
+        validity_score = 100.0 - deductions["validity"]
         
         # Ensure scores don't go below 0
         completeness_score = max(0, completeness_score)
@@ -609,12 +670,22 @@ class StreamingDataValidator:
             "validity": round(validity_score, 2)
         }
     
+    def _score_category(self, rule_name: str) -> str:
+        """Score category a rule's issues deduct from, memoized per rule name"""
+        category = self._score_category_cache.get(rule_name)
+        if category is None:
+            if "completeness" in rule_name or "null" in rule_name:
+                category = "completeness"
+            elif "consistency" in rule_name or "duplicate" in rule_name:
+                category = "consistency"
+            else:
+                category = "validity"
+            self._score_category_cache[rule_name] = category
+        return category
+    
     def _count_total_rules(self, platform: str) -> int:
         """Count total number of validation rules for a platform"""
-        # This is an approximation based on the rules defined
-        base_rules = 8  # General rules
-        platform_rules = len(self.platform_specific_rules.get(platform, {}))
-        return base_rules + platform_rules
+        return self._total_rules_by_platform.get(platform, 8)
     
     def generate_quality_report(self, validation_result: ValidationResult) -> str:
         """Generate a human-readable quality report"""
@@ -636,20 +707,14 @@ class StreamingDataValidator:
             report.append("VALIDATION ISSUES:")
             report.append("-" * 40)
             
-            # Group issues by severity
-            critical_issues = [i for i in validation_result.issues if i.severity == ValidationSeverity.CRITICAL]
-            error_issues = [i for i in validation_result.issues if i.severity == ValidationSeverity.ERROR]
-            warning_issues = [i for i in validation_result.issues if i.severity == ValidationSeverity.WARNING]
-            info_issues = [i for i in validation_result.issues if i.severity == ValidationSeverity.INFO]
+            # Group issues by severity in one pass (enum order: CRITICAL, ERROR, WARNING, INFO)
+            issues_by_severity = {severity: [] for severity in ValidationSeverity}
+            for issue in validation_result.issues:
+                issues_by_severity[issue.severity].append(issue)
             
-            for severity_name, issues in [
-                ("CRITICAL", critical_issues),
-                ("ERROR", error_issues), 
-                ("WARNING", warning_issues),
-                ("INFO", info_issues)
-            ]:
+            for severity, issues in issues_by_severity.items():
                 if issues:
-                    report.append(f"\n{severity_name} ({len(issues)} issues):")
+                    report.append(f"\n{severity.name} ({len(issues)} issues):")
                     for issue in issues:
                         report.append(f"  • {issue.message}")
                         if issue.sample_values:
@@ -0,0 +1,10 @@
+"""
+Shared pytest setup: make the project root importable so tests can use `src.` imports
+"""
+
+import sys
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
@@ -0,0 +1,184 @@
+"""
+Integration tests for StreamingDataProcessor against a SQLite database
+"""
+
+import pandas as pd
+import pytest
+
+from src.database.models import initialize_database, Artist, Track, StreamingRecord, DataProcessingLog
+from src.etl.data_processor import StreamingDataProcessor
+
+
+@pytest.fixture
+def db_manager(tmp_path):
+    """A fresh SQLite database with the platform reference data loaded"""
+    db = initialize_database(f"sqlite:///{tmp_path / 'streaming_analytics.db'}")
+    yield db
+    db.engine.dispose()
+
+
+@pytest.fixture
+def processor(db_manager):
+    return StreamingDataProcessor(db_manager)
+
+
+def spotify_topd_frame(**columns) -> pd.DataFrame:
+    """A Spotify TOPD frame; keyword arguments add or override columns"""
+    rows = len(next(iter(columns.values()))) if columns else 1
+    data = {
+        'artists': ['Artist'] * rows,
+        'track_name': ['Track'] * rows,
+        'streams30s': [100] * rows,
+        'week_start_date': ['2024-01-01'] * rows,
+    }
+    data.update(columns)
+    return pd.DataFrame(data)
+
+
+def test_case_and_whitespace_variant_artists_merge(processor, db_manager):
+    df = spotify_topd_frame(
+        artists=['Adele', '  adele ', 'ADELE'],
+        track_name=['Hello', 'hello', 'Hello '],
+    )
+
+    result = processor._process_dataframe(df, 'spo-spotify', 'spotify_topd.csv')
+
+    assert result.success
+    assert result.records_processed == 3
+    with db_manager.get_session() as session:
+        artists = session.query(Artist).all()
+        tracks = session.query(Track).all()
+        assert [(artist.name, artist.name_normalized) for artist in artists] == [('Adele', 'adele')]
+        assert [(track.title, track.artist_id) for track in tracks] == [('Hello', artists[0].id)]
+        assert {record.track_id for record in session.query(StreamingRecord)} == {tracks[0].id}
+
+
+def test_duplicate_isrc_is_kept_on_one_track_only(processor, db_manager):
+    first = spotify_topd_frame(track_name=['Original'], isrc=['USRC17607839'])
+    assert processor._process_dataframe(first, 'spo-spotify', 'first.csv').success
+
+    # A second file reuses the stored ISRC and repeats a new one within the file
+    second = spotify_topd_frame(
+        track_name=['Remix', 'Live', 'Acoustic'],
+        isrc=['USRC17607839', 'GBAYE0601498', 'GBAYE0601498'],
+    )
+    result = processor._process_dataframe(second, 'spo-spotify', 'second.csv')
+
+    assert result.success
+    assert result.records_processed == 3
+    with db_manager.get_session() as session:
+        isrcs = {track.title: track.isrc for track in session.query(Track)}
+    assert isrcs == {
+        'Original': 'USRC17607839',
+        'Remix': None,
+        'Live': 'GBAYE0601498',
+        'Acoustic': None,
+    }
+
+
+def test_unchanged_file_is_skipped(processor, db_manager, tmp_path):
+    file_path = tmp_path / 'spo-spotify_topd_20240101.csv'
+    spotify_topd_frame(artists=['A', 'B'], track_name=['x', 'y']).to_csv(file_path, index=False)
+
+    first = processor.process_file(str(file_path))
+    second = processor.process_file(str(file_path))
+
+    assert first.success and not first.skipped
+    assert first.records_processed == 2
+    assert second.success and second.skipped
+    with db_manager.get_session() as session:
+        assert session.query(StreamingRecord).count() == 2
+        logs = session.query(DataProcessingLog).all()
+        assert [(log.processing_status, log.mtime_ns) for log in logs] == [
+            ('completed', file_path.stat().st_mtime_ns)
+        ]
+
+
+def test_invalid_metric_values_load_as_zero(processor, db_manager):
+    df = spotify_topd_frame(
+        track_name=['valid', 'missing', 'negative', 'text'],
+        streams30s=['1,234', None, '-5', 'n/a'],
+    )
+
+    result = processor._process_dataframe(df, 'spo-spotify', 'spotify_topd.csv')
+
+    assert result.success
+    assert result.records_processed == 4
+    with db_manager.get_session() as session:
+        values = {record.track_title: float(record.metric_value) for record in session.query(StreamingRecord)}
+    assert values == {'valid': 1234.0, 'missing': 0.0, 'negative': 0.0, 'text': 0.0}
+
+
+def test_user_demographic_round_trips_as_dict(processor, db_manager):
+    df = spotify_topd_frame(
+        track_name=['both', 'age only', 'none'],
+        age_bucket=['18-24', '25-34', None],
+        gender=['female', ' ', None],
+    )
+
+    result = processor._process_dataframe(df, 'spo-spotify', 'spotify_topd.csv')
+
+    assert result.success
+    with db_manager.get_session() as session:
+        demographics = {record.track_title: record.user_demographic for record in session.query(StreamingRecord)}
+    assert demographics == {
+        'both': {'age_bucket': '18-24', 'gender': 'female'},
+        'age only': {'age_bucket': '25-34'},
+        'none': None,
+    }
+
+
+def test_upgrade_schema_migrates_legacy_database(db_manager, processor):
+    # Roll the schema back to its pre-upsert shape: no mtime_ns, no unique natural keys
+    with db_manager.engine.begin() as conn:
+        for statement in (
+            "DROP INDEX ix_data_processing_logs_file_stat",
+            "ALTER TABLE data_processing_logs DROP COLUMN mtime_ns",
+            "DROP INDEX ix_artists_name_normalized",
+            "CREATE INDEX ix_artists_name_normalized ON artists (name_normalized)",
+            "DROP INDEX ix_tracks_title_artist",
+            "INSERT INTO artists (id, name, name_normalized, created_at, updated_at) VALUES "
+            "(1, 'Adele', 'adele', '2024-01-01', '2024-01-01'), (2, 'adele', 'adele', '2024-01-01', '2024-01-01')",
+            "INSERT INTO tracks (id, title, title_normalized, artist_id, isrc, created_at, updated_at) VALUES "
+            "(1, 'Hello', 'hello', 1, NULL, '2024-01-01', '2024-01-01'), "
+            "(2, 'Hello', 'hello', 2, 'GBBKS1500214', '2024-01-01', '2024-01-01')",
+            "INSERT INTO streaming_records (id, date, platform_id, track_id, metric_type, metric_value, created_at, updated_at) "
+            "VALUES ('00000000-0000-0000-0000-000000000001', '2024-01-01', 1, 2, 'streams', 5, '2024-01-01', '2024-01-01')",
+        ):
+            conn.exec_driver_sql(statement)
+    assert not db_manager.has_natural_key_indexes()
+
+    db_manager.upgrade_schema()
+    db_manager.upgrade_schema()  # idempotent
+
+    assert db_manager.has_natural_key_indexes()
+    with db_manager.get_session() as session:
+        assert [(artist.id, artist.name) for artist in session.query(Artist)] == [(1, 'Adele')]
+        assert [(track.id, track.artist_id, track.isrc) for track in session.query(Track)] == [(1, 1, 'GBBKS1500214')]
+        assert [record.track_id for record in session.query(StreamingRecord)] == [1]
+
+    # The upgraded database takes the upsert path end to end
+    df = spotify_topd_frame(artists=['ADELE', 'Newcomer'], track_name=['hello', 'Debut'])
+    result = processor._process_dataframe(df, 'spo-spotify', 'spotify_topd.csv')
+    assert result.success and result.records_processed == 2
+    assert processor._use_upserts
+
+
+def test_mixed_offset_dates_keep_their_local_date(processor, db_manager):
+    df = spotify_topd_frame(
+        track_name=['plus two', 'minus five', 'unparseable'],
+        week_start_date=[
+            pd.Timestamp('2024-01-05T23:30:00+02:00'),
+            pd.Timestamp('2024-01-06T22:00:00-05:00'),
+            'not a date',
+        ],
+    )
+    
+    result = processor._process_dataframe(df, 'spo-spotify', 'spotify_topd.csv')
+    
+    assert result.success
+    with db_manager.get_session() as session:
+        dates = {record.track_title: record.date.date() for record in session.query(StreamingRecord)}
+    assert dates['plus two'] == pd.Timestamp('2024-01-05').date()
+    assert dates['minus five'] == pd.Timestamp('2024-01-06').date()
+    assert dates['unparseable'] == pd.Timestamp.now().date()
@@ -0,0 +1,35 @@
+"""
+Unit tests for StreamingDataValidator
+"""
+
+import pandas as pd
+
+from src.etl.validators.data_validator import StreamingDataValidator
+
+
+def test_duration_columns_are_not_validated_as_dates():
+    """Numeric watch_time values must not be flagged as unparseable dates"""
+    df = pd.DataFrame({
+        'video_id': ['v1', 'v2', 'v3', 'v4', 'v5'],
+        'views': [10, 20, 30, 40, 50],
+        'date': ['2024-01-01', '2024-01-02', '2024-01-03', '2024-01-04', '2024-01-05'],
+        'watch_time': [1.5, 2.5, 3.5, 4.5, 5.5],
+    })
+    
+    result = StreamingDataValidator().validate_dataset(df, 'vvo-vevo')
+    
+    assert not [issue for issue in result.issues if issue.rule_name == 'invalid_date_format']
+    assert result.validity_score == 100.0
+
+
+def test_unparseable_date_column_is_still_flagged():
+    """Real date columns keep their invalid_date_format check"""
+    df = pd.DataFrame({
+        'video_id': ['v1', 'v2', 'v3'],
+        'views': [10, 20, 30],
+        'date': ['2024-01-01', 'not a date', 'also not a date'],
+    })
+    
+    result = StreamingDataValidator().validate_dataset(df, 'vvo-vevo')
+    
+    assert [issue.column for issue in result.issues if issue.rule_name == 'invalid_date_format'] == ['date']
@@ -0,0 +1,40 @@
+"""
+Unit tests for EnhancedETLParser
+"""
+
+import pandas as pd
+import pytest
+
+from src.etl.parsers.enhanced_parser import EnhancedETLParser
+
+
+@pytest.fixture
+def parser():
+    return EnhancedETLParser()
+
+
+def test_mixed_offset_timestamps_parse_tz_aware(parser):
+    """SoundCloud-style timestamps whose offsets differ keep their own offsets"""
+    df = pd.DataFrame({'timestamp': ['2024-12-01 17:18:10.040+00', '2024-12-01 17:18:10.040+01']})
+    
+    parsed = parser._standardize_dates(df, 'scu-soundcloud')['timestamp']
+    
+    assert parsed.tolist() == [
+        pd.Timestamp('2024-12-01 17:18:10.040+00:00'),
+        pd.Timestamp('2024-12-01 17:18:10.040+01:00'),
+    ]
+    assert [value.utcoffset() for value in parsed] == [pd.Timedelta(0), pd.Timedelta(hours=1)]
+
+
+def test_mixed_format_fallback_keeps_mixed_offset_dates(parser):
+    """Values left for format='mixed' with differing offsets are parsed, never turned into NaT"""
+    series = pd.Series(['2024-01-05T10:00:00+02:00', '2024-01-06T10:00:00-05:00', 'not a date'])
+    
+    parsed = parser._parse_date_column(series, 'vvo-vevo')
+    
+    assert parsed.iloc[:2].tolist() == [
+        pd.Timestamp('2024-01-05T10:00:00+02:00'),
+        pd.Timestamp('2024-01-06T10:00:00-05:00'),
+    ]
+    assert [value.utcoffset() for value in parsed.iloc[:2]] == [pd.Timedelta(hours=2), pd.Timedelta(hours=-5)]
+    assert pd.isna(parsed.iloc[2])